@@ -0,0 +1,187 @@
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+
+from boardgame_set import constants as CONST  # noqa
+
+# 🧹 프레임별 메모리 할당 추적 (tracemalloc)
+#    transient: 한 프레임 안에서 잠깐 만들어졌다 버려진 양 (프레임 중 최고치 - 시작 시점)
+#    growth: warmup 이후 프레임당 늘어난 양 (장시간 실행시 메모리 증가)
+#    python -m boardgame_set.alloc_tracker [--frames 600] [--max-growth 256] [-o report.json]
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+class AllocationTracker:
+    def __init__(self, warmup=60, enabled=True, nframes=1):
+        self.enabled = enabled
+        self.warmup = warmup  # 캐시가 채워지는 초반 프레임은 제외
+        self.nframes = nframes  # 호출 위치로 묶을 때 볼 스택 깊이
+        self.frame_count = 0
+        self.started_here = False
+
+        self.baseline = None
+        self.baseline_bytes = 0
+        self.transient_total = 0
+        self.transient_max = 0
+        self._frame_start = None
+
+    @property
+    def measured_frames(self):
+        return max(0, self.frame_count - self.warmup)
+
+    def start(self):
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+            self.started_here = True
+
+    def stop(self):
+        if self.started_here:
+            tracemalloc.stop()
+            self.started_here = False
+
+    def begin_frame(self):
+        if not self.enabled or not tracemalloc.is_tracing():
+            return
+        self._frame_start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def end_frame(self):
+        if self._frame_start is None:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        self.frame_count += 1
+        if self.frame_count == self.warmup:
+            self.take_baseline()
+        elif self.frame_count > self.warmup:
+            transient = peak - self._frame_start
+            self.transient_total += transient
+            self.transient_max = max(self.transient_max, transient)
+        self._frame_start = None
+
+    def take_baseline(self):
+        tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)  # 필터 패턴 캐시를 미리 채워 측정에서 제외
+        self.baseline = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+        self.baseline_bytes = tracemalloc.get_traced_memory()[0]
+
+    def top_sites(self, snapshot, limit=10):
+        # warmup 이후 늘어난 양이 큰 호출 위치 순
+        if self.baseline is None:
+            return []
+        stats = snapshot.compare_to(self.baseline, 'lineno')
+        sites = []
+        for stat in stats:
+            if stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            filename = frame.filename
+            if filename.startswith(PACKAGE_DIR):
+                filename = os.path.relpath(filename, os.path.dirname(PACKAGE_DIR))
+            sites.append({
+                'site': f'{filename}:{frame.lineno}',
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff,
+            })
+            if len(sites) >= limit:
+                break
+        return sites
+
+    def report(self, limit=10):
+        frames = self.measured_frames
+        if not frames or not tracemalloc.is_tracing():
+            return {'frames': frames, 'transient_bytes_per_frame': 0, 'transient_max_bytes': 0,
+                    'growth_bytes_per_frame': 0, 'top_sites': []}
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+        current = tracemalloc.get_traced_memory()[0]
+        return {
+            'frames': frames,
+            'transient_bytes_per_frame': self.transient_total / frames,
+            'transient_max_bytes': self.transient_max,
+            'growth_bytes_per_frame': (current - self.baseline_bytes) / frames,
+            'top_sites': self.top_sites(snapshot, limit),
+        }
+
+
+def check(report, max_growth=CONST.ALLOC_MAX_GROWTH_PER_FRAME, max_transient=None):
+    # 기준을 넘은 항목의 설명 목록 (비어 있으면 통과)
+    failures = []
+    if report['growth_bytes_per_frame'] > max_growth:
+        failures.append(f'프레임당 {report["growth_bytes_per_frame"]:.1f}B 증가 (허용 {max_growth}B)')
+    if max_transient is not None and report['transient_bytes_per_frame'] > max_transient:
+        failures.append(f'프레임당 {report["transient_bytes_per_frame"]:.1f}B 임시 할당 (허용 {max_transient}B)')
+    return failures
+
+
+def run_headless(frames=600, warmup=120, seed=0, dirty_rects=False, fps=120, limit=10):
+    # 화면 없이 정해진 입력(세트 클릭, 힌트)으로 게임을 돌리며 할당을 측정
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import pygame
+    from boardgame_set import main
+
+    cwd = os.getcwd()
+    os.chdir(PACKAGE_DIR)  # 카드 이미지 경로(CONST.IMAGE_DIR)가 패키지 기준 상대 경로
+    tracker = AllocationTracker(warmup=warmup)
+    try:
+        game = main.SetGame(dirty_rects=dirty_rects, seed=seed, alloc_tracker=tracker)
+        game.log_start()
+        tracker.start()
+        for frame in range(frames):
+            if frame % 90 == 10 and not game.animating:
+                board = game.board
+                if board.hint_sets:
+                    for idx in board.hint_sets[0]:
+                        pos = board.sprites[idx].rect.center
+                        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1))
+                else:
+                    pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_h))
+            game.run_frame()
+            if fps:
+                game.clock.tick(fps)
+        return tracker.report(limit)
+    finally:
+        tracker.stop()
+        os.chdir(cwd)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='SET 게임 프레임별 메모리 할당 추적')
+    parser.add_argument('--frames', type=int, default=600, help='실행할 프레임 수')
+    parser.add_argument('--warmup', type=int, default=120, help='측정에서 제외할 초반 프레임 수')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dirty-rects', action='store_true', help='dirty rect 모드로 실행')
+    parser.add_argument('--max-growth', type=float, default=CONST.ALLOC_MAX_GROWTH_PER_FRAME,
+                        help='허용하는 프레임당 메모리 증가량 (바이트)')
+    parser.add_argument('--max-transient', type=float, help='허용하는 프레임당 임시 할당량 (바이트)')
+    parser.add_argument('--top', type=int, default=10, help='출력할 호출 위치 수')
+    parser.add_argument('-o', '--output', help='결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    report = run_headless(args.frames, args.warmup, args.seed, args.dirty_rects, limit=args.top)
+    print(f'frames: {report["frames"]}')
+    print(f'transient: {report["transient_bytes_per_frame"]:.1f} B/frame (max {report["transient_max_bytes"]} B)')
+    print(f'growth: {report["growth_bytes_per_frame"]:.1f} B/frame')
+    for site in report['top_sites']:
+        print(f'  {site["size_diff"]:>10} B {site["count_diff"]:>6} blocks  {site["site"]}')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    failures = check(report, args.max_growth, args.max_transient)
+    for failure in failures:
+        print(f'[ALLOC] {failure}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
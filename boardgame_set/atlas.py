@@ -0,0 +1,128 @@
+import mmap
+import os
+import struct
+
+import pygame
+
+from boardgame_set import constants as CONST  # noqa
+
+# 📦 아틀라스 파일 구조
+#   헤더  : magic(8) | version | card_width | card_height | count
+#   인덱스: 카드 파일명(NAME_SIZE 바이트, utf-8, NUL 패딩) x count
+#   픽셀  : RGBA 원시 픽셀, 카드를 세로로 이어붙인 한 장의 이미지
+MAGIC = b'SETATLAS'
+VERSION = 1
+HEADER = struct.Struct('<8sHHHH')
+NAME_SIZE = 32
+PIXEL_FORMAT = 'RGBA'
+
+
+def card_filenames():
+    names = [
+        f'{c}_{s}_{n}_{f}'
+        for c in CONST.CARD_COLORS for s in CONST.CARD_SHAPES
+        for n in CONST.CARD_COUNTS for f in CONST.CARD_FILLS
+    ]
+    return names + ['_empty_card']
+
+
+def default_path():
+    return os.path.join(CONST.IMAGE_DIR, CONST.ATLAS_FILE)
+
+
+def build_atlas(path=None, size=(CONST.CARD_WIDTH, CONST.CARD_HEIGHT)):
+    path = path or default_path()
+    names = card_filenames()
+
+    index = b''.join(name.encode('utf-8').ljust(NAME_SIZE, b'\0') for name in names)
+    pixels = []
+    for name in names:
+        original = pygame.image.load(os.path.join(CONST.IMAGE_DIR, f'{name}.png'))
+        scaled = pygame.transform.smoothscale(original, size)
+        pixels.append(pygame.image.tobytes(scaled, PIXEL_FORMAT))
+
+    # 쓰는 도중에 읽히지 않도록 임시 파일에 쓰고 교체
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, size[0], size[1], len(names)))
+        f.write(index)
+        for data in pixels:
+            f.write(data)
+    os.replace(tmp_path, path)
+    return path
+
+
+class CardAtlas:
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, width, height, count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f'{path}: 아틀라스 형식이 아닙니다.')
+
+        self.size = (width, height)
+        index_end = HEADER.size + NAME_SIZE * count
+        names = [
+            bytes(self._mmap[offset:offset + NAME_SIZE]).rstrip(b'\0').decode('utf-8')
+            for offset in range(HEADER.size, index_end, NAME_SIZE)
+        ]
+        pixel_bytes = width * height * 4 * count
+        if len(self._mmap) < index_end + pixel_bytes:
+            self.close()
+            raise ValueError(f'{path}: 아틀라스 파일이 잘렸습니다.')
+
+        # PNG 디코딩 없이 매핑된 메모리를 그대로 Surface 로 사용
+        buffer = memoryview(self._mmap)[index_end:index_end + pixel_bytes]
+        self.surface = pygame.image.frombuffer(buffer, (width, height * count), PIXEL_FORMAT)
+        self._slots = {name: i for i, name in enumerate(names)}
+        self._subsurfaces: dict[str, pygame.Surface] = {}
+
+    def __contains__(self, name):
+        return name in self._slots
+
+    def __getitem__(self, name) -> pygame.Surface:
+        if name not in self._subsurfaces:
+            width, height = self.size
+            rect = pygame.Rect(0, self._slots[name] * height, width, height)
+            self._subsurfaces[name] = self.surface.subsurface(rect)
+        return self._subsurfaces[name]
+
+    def close(self):
+        self.surface = None
+        self._subsurfaces = {}
+        self._mmap.close()
+
+    @classmethod
+    def load_or_build(cls, path=None, size=(CONST.CARD_WIDTH, CONST.CARD_HEIGHT)):
+        path = path or default_path()
+        try:
+            atlas = cls(path)
+            if atlas.size == tuple(size) and all(name in atlas for name in card_filenames()):
+                return atlas
+            atlas.close()
+        except (OSError, ValueError, struct.error):
+            pass
+
+        # 파일이 없거나 카드 크기 상수가 바뀌었으면 다시 만든다
+        build_atlas(path, size)
+        return cls(path)
+
+
+_atlas: CardAtlas | None = None
+_atlas_failed = False
+
+
+def get_atlas():
+    global _atlas, _atlas_failed
+    if _atlas is None and not _atlas_failed:
+        try:
+            _atlas = CardAtlas.load_or_build()
+        except (OSError, ValueError, pygame.error):
+            _atlas_failed = True  # 아틀라스를 쓸 수 없으면 PNG 캐시로 대체
+    return _atlas
+
+
+if __name__ == '__main__':
+    print(f'아틀라스 생성 완료: {build_atlas()}')
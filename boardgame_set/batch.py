@@ -0,0 +1,87 @@
+from functools import lru_cache
+from itertools import combinations
+
+import numpy as np
+
+from boardgame_set import set_table
+from boardgame_set.card import Card
+from boardgame_set.set_finder import encode_card
+
+# 🧮 여러 보드를 한 번에 처리하는 NumPy 세트 판정 API
+#    보드 배열: (B, N) 정수 배열, 각 칸은 카드 코드(0~80, set_finder.encode_card) 또는 EMPTY
+#    한 보드 안에 같은 카드가 두 번 나오지 않는다고 가정한다.
+EMPTY = -1
+_POW3 = np.array([27, 9, 3, 1], dtype=np.int16)
+
+
+def encode_boards(boards: list[list[Card | None]]) -> np.ndarray:
+    width = max((len(board) for board in boards), default=0)
+    encoded = np.full((len(boards), width), EMPTY, dtype=np.int16)
+    for row, board in enumerate(boards):
+        for col, card in enumerate(board):
+            if card:
+                encoded[row, col] = encode_card(card)
+    return encoded
+
+
+def card_digits(codes) -> np.ndarray:
+    # 카드 코드 → (..., 4) 3진수 자리 (color, shape, count, fill)
+    return np.asarray(codes, dtype=np.int16)[..., None] // _POW3 % 3
+
+
+def is_set_batch(a, b, c) -> np.ndarray:
+    # 각 자리에서 세 값의 합이 3의 배수이면 모두 같거나 모두 다르다
+    total = card_digits(a) + card_digits(b) + card_digits(c)
+    return (total % 3 == 0).all(axis=-1)
+
+
+# (a, b) → 세트를 완성하는 세 번째 카드 코드 (set_table.THIRD 를 배열로)
+THIRD_CARD = np.frombuffer(set_table.THIRD, dtype=np.uint8).reshape(81, 81).astype(np.int16)
+
+
+@lru_cache(maxsize=None)
+def triple_indices(n) -> np.ndarray:
+    # combinations(range(n), 3) 순서 (set_finder.find_all_sets 와 같은 순서)
+    return np.array(list(combinations(range(n), 3)), dtype=np.intp).reshape(-1, 3)
+
+
+def _iter_chunks(boards, chunk_size):
+    for start in range(0, len(boards), chunk_size):
+        yield start, boards[start:start + chunk_size]
+
+
+def count_sets(boards, chunk_size=65536) -> np.ndarray:
+    # 카드 쌍마다 세 번째 카드가 보드에 있는지 확인. 세트 하나가 쌍 3개에서 잡히므로 3으로 나눈다
+    boards = np.asarray(boards, dtype=np.int16)
+    counts = np.zeros(len(boards), dtype=np.int32)
+    if boards.ndim != 2 or boards.shape[1] < 3:
+        return counts
+
+    i, j = np.triu_indices(boards.shape[1], 1)
+    for start, chunk in _iter_chunks(boards, chunk_size):
+        a, b = chunk[:, i], chunk[:, j]
+        valid = (a != EMPTY) & (b != EMPTY)
+        third = THIRD_CARD[np.where(valid, a, 0), np.where(valid, b, 0)]
+
+        # 보드별 카드 존재 여부 (마지막 칸은 EMPTY 용 더미)
+        present = np.zeros((len(chunk), 82), dtype=bool)
+        present[np.arange(len(chunk))[:, None], np.where(chunk == EMPTY, 81, chunk)] = True
+        present[:, 81] = False
+
+        hits = present[np.arange(len(chunk))[:, None], third] & valid
+        counts[start:start + len(chunk)] = hits.sum(axis=1) // 3
+    return counts
+
+
+def set_masks(boards, chunk_size=16384) -> tuple[np.ndarray, np.ndarray]:
+    # (B, T) 마스크와 (T, 3) 칸 번호 반환. mask[b, t] 는 triples[t] 가 보드 b 에서 세트인지 여부
+    boards = np.asarray(boards, dtype=np.int16)
+    triples = triple_indices(boards.shape[1])
+    masks = np.zeros((len(boards), len(triples)), dtype=bool)
+
+    for start, chunk in _iter_chunks(boards, chunk_size):
+        a, b, c = (chunk[:, triples[:, n]] for n in range(3))
+        valid = (a != EMPTY) & (b != EMPTY) & (c != EMPTY)
+        third = THIRD_CARD[np.where(valid, a, 0), np.where(valid, b, 0)]
+        masks[start:start + len(chunk)] = valid & (third == c)
+    return masks, triples
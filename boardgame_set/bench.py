@@ -0,0 +1,170 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+# 🖥️ 화면 없는 리눅스 서버에서도 돌도록 SDL 더미 드라이버 사용 (pygame import 전에 설정)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+from boardgame_set.card import Card  # noqa: E402
+from boardgame_set.logger import GameLogger  # noqa: E402
+from boardgame_set.rng import GameRng  # noqa: E402
+from boardgame_set import set_finder  # noqa: E402
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(PACKAGE_DIR, 'bench_baseline.json')
+
+# ⏱️ 보드·렌더링·로그 핫패스 벤치마크
+#    python -m boardgame_set.bench [--quick] [-o result.json] [--baseline bench_baseline.json] [--save-baseline]
+
+
+def measure(func, repeat=7, min_time=0.05):
+    # 한 번 실행이 min_time 이상 걸리도록 반복 횟수를 정한 뒤 repeat 번 측정 (호출당 마이크로초)
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return {'median_us': statistics.median(samples), 'min_us': min(samples), 'number': number, 'repeat': repeat}
+
+
+def bench_set_finder(results, options):
+    rng = GameRng(0).substream('bench')
+    cards = Card.all()
+    for size in (12, 15, 21, 27, 81):
+        board = rng.sample(cards, size)
+        results[f'find_all_sets[{size}]'] = measure(lambda: set_finder.find_all_sets(board), **options)
+
+    a, b, c = cards[0], cards[1], cards[2]
+    results['is_set'] = measure(lambda: set_finder.is_set(a, b, c), **options)
+
+
+def bench_rendering(results, options):
+    from boardgame_set import main
+
+    screen = pygame.display.set_mode((main.CONST.WINDOW_WIDTH, main.CONST.WINDOW_HEIGHT))
+    sprite = main.CardSprite(Card.from_id(0), (0, 0))
+
+    def fade_cycle():
+        sprite.start_fade_out(Card.from_id(1) if sprite.card is Card.from_id(0) else Card.from_id(0))
+        while sprite.state != 'idle':
+            sprite.update()
+            sprite.draw(screen)
+
+    results['CardSprite.fade_cycle'] = measure(fade_cycle, **options)
+
+    for dirty_rects in (False, True):
+        game = main.SetGame(dirty_rects=dirty_rects, seed=0)
+        game.update_screen()
+        name = 'SetGame.update_screen[dirty]' if dirty_rects else 'SetGame.update_screen'
+        results[name] = measure(game.update_screen, **options)
+    pygame.time.set_timer(main.user_event.animation_done, 0)
+
+
+def bench_logger(results, options, sizes):
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f'game_{size}.log')
+            line = '2025-07-29 21:41:39 | [SET_CHECK] 세트 성공! | 조합: RED~1▤, PUR◇3■, GRN○2□\n'
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(line * (size // len(line.encode('utf-8'))))
+
+            logger = GameLogger(path, max_bytes=None)
+            counter = iter(range(10 ** 9))
+
+            def add_and_save():
+                logger.add(f'메시지 {next(counter)}', 'HINT')
+                logger.save_to_file()
+
+            results[f'GameLogger.save_to_file[{size // 1024}KB]'] = measure(add_and_save, **options)
+            logger.close()
+
+
+def run(quick=False):
+    options = {'repeat': 3, 'min_time': 0.01} if quick else {}
+    results = {}
+
+    cwd = os.getcwd()
+    os.chdir(PACKAGE_DIR)  # 카드 이미지 경로(CONST.IMAGE_DIR)가 패키지 기준 상대 경로
+    try:
+        bench_set_finder(results, options)
+        bench_rendering(results, options)
+        bench_logger(results, options, [0, 1024 * 1024] if quick else [0, 1024 * 1024, 8 * 1024 * 1024])
+    finally:
+        os.chdir(cwd)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+        },
+        'results': results,
+    }
+
+
+def compare(report, baseline, threshold):
+    # 기준보다 threshold 비율 이상 느려진 항목 목록 (잡음이 적은 최솟값끼리 비교)
+    regressions = []
+    for name, result in report['results'].items():
+        if name not in baseline['results']:
+            continue
+        ratio = result['min_us'] / baseline['results'][name]['min_us']
+        if ratio > 1 + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='SET 게임 벤치마크')
+    parser.add_argument('--quick', action='store_true', help='반복 횟수를 줄여 빠르게 실행')
+    parser.add_argument('-o', '--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='비교할 기준 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.3, help='허용하는 느려짐 비율 (0.3 = 30%%)')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준 결과로 저장')
+    args = parser.parse_args(argv)
+
+    report = run(args.quick)
+    for name, result in report['results'].items():
+        print(f'{name:>36}: {result["median_us"]:12.2f} us (min {result["min_us"]:.2f})')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.threshold)
+    for name, ratio in regressions:
+        print(f'[REGRESSION] {name}: 기준 대비 {ratio:.2f}배')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
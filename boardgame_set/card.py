@@ -0,0 +1,74 @@
+from boardgame_set import constants as CONST  # noqa
+
+_COLOR_NAMES = {'red': 'RED', 'green': 'GRN', 'purple': 'PUR'}
+_SHAPE_SYMBOLS = {'oval': '○', 'squiggle': '~', 'diamond': '◇'}
+_FILL_SYMBOLS = {'solid': '■', 'striped': '▤', 'open': '□'}
+
+
+# 💡 카드 클래스 (81장 모두 미리 만들어 두고 같은 속성이면 같은 객체를 돌려준다)
+#    id 는 속성의 3진수 인코딩 (color·27 + shape·9 + count·3 + fill), 0~80
+class Card:
+    __slots__ = ('color', 'shape', 'count', 'fill', 'id', 'filename', '_label')
+
+    _interned: dict[tuple, 'Card'] = {}
+    _by_id: list['Card'] = []
+
+    def __new__(cls, color, shape, count, fill):
+        try:
+            return cls._interned[(color, shape, count, fill)]
+        except KeyError:
+            raise ValueError(f'존재하지 않는 카드입니다: {color}, {shape}, {count}, {fill}') from None
+
+    @classmethod
+    def _create(cls, card_id, color, shape, count, fill):
+        card = object.__new__(cls)
+        for name, value in (
+            ('color', color), ('shape', shape), ('count', count), ('fill', fill), ('id', card_id),
+            ('filename', f'{color}_{shape}_{count}_{fill}'),
+            ('_label', f'{_COLOR_NAMES[color]}{_SHAPE_SYMBOLS[shape]}{count}{_FILL_SYMBOLS[fill]}'),
+        ):
+            object.__setattr__(card, name, value)
+        return card
+
+    @classmethod
+    def from_id(cls, card_id) -> 'Card':
+        return cls._by_id[card_id]
+
+    @classmethod
+    def all(cls) -> tuple['Card', ...]:
+        return tuple(cls._by_id)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Card 는 변경할 수 없습니다.')
+
+    def __eq__(self, other):
+        return self is other
+
+    def __hash__(self):
+        return self.id
+
+    def __reduce__(self):
+        return _card_from_id, (self.id,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return self._label
+
+
+def _card_from_id(card_id):
+    return Card.from_id(card_id)
+
+
+for _c in CONST.CARD_COLORS:
+    for _s in CONST.CARD_SHAPES:
+        for _n in CONST.CARD_COUNTS:
+            for _f in CONST.CARD_FILLS:
+                _card = Card._create(len(Card._by_id), _c, _s, _n, _f)
+                Card._interned[(_c, _s, _n, _f)] = _card
+                Card._by_id.append(_card)
+del _c, _s, _n, _f, _card
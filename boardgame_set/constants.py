@@ -10,3 +10,24 @@ CARD_PADDING = 30
 
 MESSAGE_BOX_WIDTH = 480
 MESSAGE_BOX_HEIGHT = 250
+
+# 🃏 카드 속성 (순서가 곧 3진수 인코딩의 자리값)
+CARD_COLORS = ('red', 'green', 'purple')
+CARD_SHAPES = ('oval', 'squiggle', 'diamond')
+CARD_COUNTS = (1, 2, 3)
+CARD_FILLS = ('solid', 'striped', 'open')
+
+# 🖼️ 카드 이미지
+IMAGE_DIR = 'images'
+IMAGE_CACHE_BYTES = 8 * 1024 * 1024  # 카드 82장(100x150 RGBA) ≈ 4.9MB
+ATLAS_FILE = 'cards.atlas'  # python -m boardgame_set.atlas 로 생성 (크기 변경시 자동 재생성)
+
+# 🖥️ 화면 갱신
+DIRTY_RECTS = False  # True 이면 바뀐 영역만 다시 그린다 (저전력 디스플레이용)
+
+# 🔤 글꼴 / 텍스트
+FONT_NAME = '나눔고딕'
+TEXT_CACHE_SIZE = 256  # 렌더링된 텍스트 Surface 최대 보관 개수
+
+# 🧹 메모리 할당 추적 (python -m boardgame_set.alloc_tracker)
+ALLOC_MAX_GROWTH_PER_FRAME = 256  # warmup 이후 허용하는 프레임당 메모리 증가량 (바이트)
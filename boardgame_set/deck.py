@@ -0,0 +1,64 @@
+from boardgame_set.card import Card
+from boardgame_set.set_finder import card_from_code
+
+CARD_COUNT = 81
+
+
+# 🂠 카드 코드(0~80) 정수 배열 + 위치 색인으로 만든 덱
+#    뽑기·넣기·빼기·포함 여부 모두 O(1) (빼는 자리는 마지막 카드로 채운다)
+class Deck:
+    def __init__(self, cards=()):
+        self._codes: list[int] = []
+        self._positions = [-1] * CARD_COUNT
+        self.extend(cards)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __bool__(self):
+        return bool(self._codes)
+
+    def __iter__(self):
+        return (card_from_code(code) for code in self._codes)
+
+    def __contains__(self, card):
+        return isinstance(card, Card) and self._positions[card.id] >= 0
+
+    def __repr__(self):
+        return f'Deck({len(self)} cards)'
+
+    def add(self, card: Card):
+        code = card.id
+        if self._positions[code] >= 0:
+            raise ValueError(f'{card!r} 는 이미 덱에 있습니다.')
+        self._positions[code] = len(self._codes)
+        self._codes.append(code)
+
+    def extend(self, cards):
+        for card in cards:
+            self.add(card)
+
+    def remove(self, card: Card):
+        code = card.id
+        position = self._positions[code]
+        if position < 0:
+            raise ValueError(f'{card!r} 는 덱에 없습니다.')
+        self._pop_at(position)
+
+    def draw(self, rng) -> Card:
+        if not self._codes:
+            raise IndexError('덱이 비었습니다.')
+        return card_from_code(self._pop_at(rng.randrange(len(self._codes))))
+
+    def draw_many(self, rng, count) -> list[Card]:
+        # 중복 없이 count 장 뽑기 (덱보다 많이 요청하면 남은 카드 전부)
+        return [self.draw(rng) for _ in range(min(count, len(self._codes)))]
+
+    def _pop_at(self, position):
+        codes, positions = self._codes, self._positions
+        code, last = codes[position], codes[-1]
+        codes[position] = last
+        positions[last] = position
+        codes.pop()
+        positions[code] = -1
+        return code
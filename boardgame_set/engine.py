@@ -0,0 +1,167 @@
+import dataclasses
+import random
+
+from boardgame_set.card import Card
+from boardgame_set.deck import Deck
+from boardgame_set.rng import GameRng
+from boardgame_set import set_finder
+
+# ⚙️ pygame 없이 동작하는 SET 게임 규칙 (덱, 보드, 선택, 세트 판정, 힌트, 교체)
+#    화면/타이머/로그 처리는 main.GameBoard, main.SetGame 이 담당한다.
+
+
+def generate_deck(for_test=False, rng=None):
+    deck = list(Card.all())  # 카드는 게임마다 새로 만들지 않고 공유한다
+
+    if for_test:
+        return (rng or random).sample(deck, 12)
+    return deck
+
+
+@dataclasses.dataclass
+class CheckResult:
+    cards: list[Card]
+    is_set: bool
+    deck_depleted: bool = False
+
+
+@dataclasses.dataclass
+class HintResult:
+    indices: tuple[int, ...] = ()  # 힌트로 보여줄 세트
+    replaced: list[tuple[int, Card | None]] = dataclasses.field(default_factory=list)  # 전체 교체된 카드
+    deck_depleted: bool = False
+
+
+class SetEngine:
+    def __init__(self, board_size=12, rng: GameRng | None = None, seed=None):
+        # 같은 시드면 같은 게임이 재현된다 (rng.seed 로 확인)
+        self.rng = rng or GameRng(seed)
+        self.deck = Deck(generate_deck())
+        self.deck_depleted = False
+
+        self.slots: list[Card | None] = self.deal(board_size)
+        self.selected: list[int] = []
+        self.matched_sets: list[list[Card]] = []
+        self.failure_count = 0
+
+        # 보드에 있는 세트 목록은 바뀐 칸만 반영해 갱신한다 (listener(removed, added) 로 변경 통지)
+        self.hint_listeners = []
+        self.hint_index = 0
+        self.hint_sets = self.find_all_sets()
+
+    def get_score(self):
+        return len(self.matched_sets) * 3
+
+    @property
+    def is_over(self):
+        return not self.deck and not self.hint_sets
+
+    def deal(self, count):
+        return self.deck.draw_many(self.rng.deal, count)
+
+    def find_all_sets(self):
+        return set_finder.find_all_sets(self.slots)
+
+    def has_remaining_set(self):
+        return bool(set_finder.find_all_sets([card for card in self.slots if card] + list(self.deck)))
+
+    def add_hint_listener(self, listener):
+        self.hint_listeners.append(listener)
+
+    def refresh_hint_sets(self):
+        self.set_hint_sets(self.find_all_sets())
+
+    def update_hint_sets(self, changed):
+        # 바뀐 칸이 포함된 세트는 버리고, 새로 들어온 카드가 포함된 세트만 추가
+        changed = set(changed)
+        kept = [combo for combo in self.hint_sets if changed.isdisjoint(combo)]
+        added = set_finder.find_sets_with(self.slots, changed)
+        self.set_hint_sets(sorted(kept + added))
+
+    def set_hint_sets(self, hint_sets):
+        old_sets = self.hint_sets
+        next_hint = old_sets[self.hint_index] if old_sets else None
+
+        old, new = set(old_sets), set(hint_sets)
+        self.hint_sets = hint_sets
+
+        # 다음에 보여줄 힌트가 남아 있으면 그 세트를 계속 가리키고, 없어졌으면 같은 위치(범위 안)로
+        if next_hint in new:
+            self.hint_index = hint_sets.index(next_hint)
+        elif self.hint_index >= len(hint_sets):
+            self.hint_index = 0
+
+        if old != new:
+            for listener in self.hint_listeners:
+                listener(sorted(old - new), sorted(new - old))
+
+    def toggle(self, idx):
+        # 카드 선택/해제. 상태가 바뀌었으면 True
+        if self.slots[idx] is None:
+            return False
+        if idx in self.selected:
+            self.selected.remove(idx)
+        elif len(self.selected) < 3:
+            self.selected.append(idx)
+        else:
+            return False
+        return True
+
+    def clear_selection(self):
+        self.selected.clear()
+
+    def check_set(self):
+        cards = [self.slots[i] for i in self.selected if self.slots[i]]
+        if len(cards) != 3:
+            return None
+
+        result = CheckResult(cards, set_finder.is_set(*cards))
+        if result.is_set:
+            self.matched_sets.append(cards)  # 선택은 replace_selected 에서 사용하므로 유지
+        else:
+            self.failure_count += 1
+            self.selected.clear()
+
+        if not self.hint_sets and not self.deck:
+            self.deck_depleted = result.deck_depleted = True
+            self.selected.clear()
+        return result
+
+    def replace_selected(self):
+        # 세트 성공한 자리를 덱에서 채우고, 덱이 비었으면 빈 자리로 남긴다
+        replaced = []
+        for i in self.selected:
+            new_card = self.deck.draw(self.rng.refill) if self.deck else None
+            self.slots[i] = new_card
+            replaced.append((i, new_card))
+
+        self.selected.clear()
+        self.update_hint_sets(i for i, _ in replaced)
+        return replaced
+
+    def replace_all(self):
+        self.deck.extend(card for card in self.slots if card)
+        new_cards = self.deck.draw_many(self.rng.reshuffle, len(self.slots))  # 중복 없이 새 카드 뽑기
+        replaced = []
+        for i in range(len(self.slots)):
+            new_card = new_cards[i] if i < len(new_cards) else None
+            self.slots[i] = new_card
+            replaced.append((i, new_card))
+
+        self.refresh_hint_sets()
+        return replaced
+
+    def hint(self):
+        self.selected.clear()
+        result = HintResult()
+        if self.hint_sets:
+            result.indices = self.hint_sets[self.hint_index]
+            self.hint_index += 1
+            if self.hint_index >= len(self.hint_sets):
+                self.hint_index = 0
+        elif self.deck and self.has_remaining_set():
+            result.replaced = self.replace_all()
+        else:
+            # 덱과 보드의 남은 카드로 세트를 만들 수 없으면 계속 교체해도 의미가 없다
+            self.deck_depleted = result.deck_depleted = True
+        return result
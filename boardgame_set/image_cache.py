@@ -0,0 +1,58 @@
+from collections import OrderedDict
+
+import pygame
+
+from boardgame_set import constants as CONST  # noqa
+
+
+# 🖼️ 파일명·크기별로 공유되는 Surface 캐시 (LRU, 바이트 예산 기준 제거)
+class SurfaceCache:
+    def __init__(self, max_bytes=CONST.IMAGE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._surfaces: OrderedDict[tuple[str, tuple[int, int]], pygame.Surface] = OrderedDict()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def __contains__(self, key):
+        return key in self._surfaces
+
+    def get(self, filename, size):
+        key = (filename, tuple(size))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = self.load(filename, size)
+        self._surfaces[key] = surface
+        self.used_bytes += self.surface_bytes(surface)
+        self.evict()
+        return surface
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.evict()
+
+    def evict(self):
+        # 가장 최근에 쓴 한 장은 예산을 넘어도 남겨둔다
+        while self.used_bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, surface = self._surfaces.popitem(last=False)
+            self.used_bytes -= self.surface_bytes(surface)
+
+    def clear(self):
+        self._surfaces.clear()
+        self.used_bytes = 0
+
+    @staticmethod
+    def load(filename, size):
+        original = pygame.image.load(f'{CONST.IMAGE_DIR}/{filename}.png').convert_alpha()
+        return pygame.transform.smoothscale(original, size)
+
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface):
+        return surface.get_pitch() * surface.get_height()
+
+
+card_images = SurfaceCache()
@@ -1,3 +1,8 @@
+import atexit
+import os
+import queue
+import threading
+from collections import deque
 from datetime import datetime
 
 
@@ -17,7 +22,6 @@ class DebugLogger:
 
 
 class GameLogger:
-    log = []
     filepath = "game.log"
     color_map = {
         "START": (0, 120, 255),
@@ -25,6 +29,24 @@ class GameLogger:
         "ERROR": (255, 80, 80)
     }
 
+    def __init__(self, filepath=None, capacity=200, max_bytes=1024 * 1024, max_entries=None, backup_count=3):
+        if filepath is not None:
+            self.filepath = filepath
+
+        # 화면 표시·이력용 기록은 최근 capacity 개만 유지
+        self.log: deque[tuple[str, str]] = deque(maxlen=capacity)
+
+        # game.log 순환: max_bytes 또는 max_entries 를 넘으면 game.log.1 ... game.log.{backup_count} 로 밀어낸다
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.backup_count = backup_count
+
+        # 파일 기록은 백그라운드 스레드가 담당 (렌더링 루프에서는 큐에 넣기만 한다)
+        self._queue = queue.Queue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        atexit.register(self.close)
+
     def add(self, message, tag=None, cards=None):
         time_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         full_msg = f'[{tag}] {message}' if tag else message
@@ -32,38 +54,147 @@ class GameLogger:
             card_info = ' | 조합: ' + ", ".join(str(c) for c in cards)
             full_msg += card_info
 
-        if self.log:
-            recent_log = self.log[-1]
-            if recent_log[1] != full_msg:
-                self.log.append((time_str, full_msg))
-        else:
-            self.log.append((time_str, full_msg))
+        if self.log and self.log[-1][1] == full_msg:
+            return
+        self.log.append((time_str, full_msg))
+        self._start_writer()
+        self._queue.put((time_str, full_msg))
+
+    def recent(self, count):
+        start = max(len(self.log) - count, 0)
+        return [self.log[i] for i in range(start, len(self.log))]
 
     def clear(self):
-        self.log = []
+        self.log.clear()
+
+    def flush(self, timeout=None):
+        # 지금까지 넣은 기록이 파일에 쓰일 때까지 대기
+        if self._writer is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout=None):
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join(timeout)
 
     def save_to_file(self, filepath=None):
-        if filepath is None:
-            filepath = self.filepath
-        last_saved_time = self.get_last_log_time(filepath)
+        if filepath is None or filepath == self.filepath:
+            self.flush()
+            return
 
+        # 다른 파일로 내보낼 때는 그 파일의 마지막 기록 이후 항목만 덧붙인다
+        last_saved_time = self.get_last_log_time(filepath)
         with open(filepath, 'a', encoding='utf-8') as f:
-            for time_str, msg in self.log:
-                current_time = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
-                if current_time > last_saved_time:
-                    if msg.startswith('[START]'):
-                        f.write('\n')
-                    f.write(f'{time_str} | {msg}\n')
+            self.write_entries(f, [
+                (time_str, msg) for time_str, msg in self.log
+                if datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S') > last_saved_time
+            ])
+
+    def _start_writer(self):
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run_writer, name='game-logger', daemon=True)
+                self._writer.start()
+
+    def _run_writer(self):
+        f = self._open_log_file()
+        running = True
+        while running:
+            items = [self._queue.get()]
+            while True:  # 쌓여 있는 항목은 한 번에 기록
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            entries, waiters = [], []
+            for item in items:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    entries.append(item)
+
+            for entry in entries:
+                if self._needs_rotation():
+                    f.close()
+                    self.rotate()
+                    f = self._open_log_file()
+                self._file_size += self.write_entries(f, [entry])
+                self._file_entries += 1
+            f.flush()
+            for waiter in waiters:
+                waiter.set()
+        f.close()
+
+    def _open_log_file(self):
+        f = open(self.filepath, 'a', encoding='utf-8')
+        self._file_size = f.tell()
+        self._file_entries = self.count_entries(self.filepath) if self.max_entries and self._file_size else 0
+        return f
+
+    def _needs_rotation(self):
+        if self.max_bytes and self._file_size >= self.max_bytes:
+            return True
+        return bool(self.max_entries and self._file_entries >= self.max_entries)
+
+    def rotate(self):
+        # game.log.{n-1} → game.log.{n}, ..., game.log → game.log.1 (가장 오래된 파일은 삭제)
+        if self.backup_count <= 0:
+            os.remove(self.filepath)
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f'{self.filepath}.{i}'
+            if os.path.exists(source):
+                os.replace(source, f'{self.filepath}.{i + 1}')
+        os.replace(self.filepath, f'{self.filepath}.1')
 
     @staticmethod
-    def get_last_log_time(filepath):
+    def write_entries(f, entries):
+        text = ''
+        for time_str, msg in entries:
+            if msg.startswith('[START]'):
+                text += '\n'
+            text += f'{time_str} | {msg}\n'
+        f.write(text)
+        return len(text.encode('utf-8'))
+
+    @staticmethod
+    def count_entries(filepath, block_size=64 * 1024):
+        count = 0
+        with open(filepath, 'rb') as f:
+            while block := f.read(block_size):
+                count += block.count(b'\n')
+        return count
+
+    @staticmethod
+    def read_last_line(filepath, block_size=1024):
+        # 파일 끝에서부터 블록 단위로 거슬러 읽어 마지막 비어 있지 않은 줄을 찾는다
+        with open(filepath, 'rb') as f:
+            position = f.seek(0, os.SEEK_END)
+            data = b''
+            while position > 0:
+                step = min(block_size, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+                stripped = data.rstrip(b'\r\n')
+                if b'\n' in stripped or position == 0:
+                    return stripped.rsplit(b'\n', 1)[-1].decode('utf-8')
+        return ''
+
+    @classmethod
+    def get_last_log_time(cls, filepath):
+        time_str = '1970-01-01 00:00:00'
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                time_str = '1970-01-01 00:00:00'
-                lines = f.readlines()
-                if lines:
-                    last_line = lines[-1]
-                    time_str = last_line.split(" | ")[0]  # 예: "125430 | 세트 성공!"
-                return datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
+            if last_line := cls.read_last_line(filepath):
+                time_str = last_line.split(" | ")[0]  # 예: "2025-07-29 21:41:28 | 세트 성공!"
         except FileNotFoundError:
-            return datetime.strptime('1970-01-01 00:00:00', '%Y-%m-%d %H:%M:%S')
+            pass
+        return datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S')
@@ -1,38 +1,37 @@
-import random
-from itertools import combinations
+import argparse
+import json
 
 import pygame
 
 from boardgame_set.user_event import UserEvent
+from boardgame_set.alloc_tracker import AllocationTracker
+from boardgame_set.atlas import get_atlas
+from boardgame_set.image_cache import card_images
+from boardgame_set.engine import SetEngine, generate_deck  # noqa: F401 (기존 import 경로 유지)
 from boardgame_set.inerface import Button, Card
 from boardgame_set.logger import DebugLogger, GameLogger
+from boardgame_set.profiler import COLUMNS as PROFILER_OVERLAY_ROWS, FrameProfiler
+from boardgame_set import set_finder
+from boardgame_set.text_cache import get_font, text_cache
 from boardgame_set import constants as CONST  # noqa
 
 user_event = UserEvent()
 debug_logger = DebugLogger()
 logger = GameLogger()
+LOG_TAG_COLORS = [(f'[{tag}]', color) for tag, color in GameLogger.color_map.items()]
 
 pygame.init()
-FONT_1 = pygame.font.SysFont("나눔고딕", 20)
-
-
-def generate_deck(for_test=False):
-    colors = ['red', 'green', 'purple']
-    shapes = ['oval', 'squiggle', 'diamond']
-    counts = [1, 2, 3]
-    fills = ['solid', 'striped', 'open']
-    deck = [Card(c, s, n, f) for c in colors for s in shapes for n in counts for f in fills]
-
-    if for_test:
-        return random.sample(deck, 12)
-    return deck
+FONT_1 = get_font(CONST.FONT_NAME, 20)
 
 
 def get_card_image(filename=None):
     if filename is None:
         filename = '_empty_card'
-    original = pygame.image.load(f'images/{filename}.png').convert_alpha()
-    return pygame.transform.smoothscale(original, (CONST.CARD_WIDTH, CONST.CARD_HEIGHT))
+    # 공유 Surface 이므로 set_alpha 등으로 직접 변경하지 말 것
+    atlas = get_atlas()
+    if atlas and filename in atlas:
+        return atlas[filename]
+    return card_images.get(filename, (CONST.CARD_WIDTH, CONST.CARD_HEIGHT))
 
 
 # 📦 카드 렌더링용 Sprite
@@ -43,6 +42,12 @@ class CardSprite(pygame.sprite.Sprite):
     is_selected = False
     is_hinted = False
 
+    # 페이드 중에만 쓰는 스프라이트 전용 사본 (공유 이미지의 alpha 를 건드리지 않기 위함)
+    _faded_image = None
+    _faded_source = None
+    # 마지막으로 그렸을 때의 상태 (dirty rect 모드에서 변경 여부 판단용)
+    _drawn_state = None
+
     def __init__(self, card: Card, position):
         super().__init__()
         self.card = card
@@ -50,6 +55,7 @@ class CardSprite(pygame.sprite.Sprite):
         self.image = get_card_image(self.card.filename)
         self.empty_image = get_card_image()
         self.rect = self.image.get_rect(topleft=self.position)
+        self.border_rect = self.rect.inflate(6, 6)  # 테두리 포함 영역 (매 프레임 새로 만들지 않도록)
 
     def update(self):
         if self.state == 'fade_out':
@@ -77,7 +83,25 @@ class CardSprite(pygame.sprite.Sprite):
                 if self.card is None:
                     self.state = 'removed'
 
-        self.image.set_alpha(self.alpha)
+    def get_display_image(self):
+        if self.alpha >= 255:
+            self._faded_image = self._faded_source = None
+            return self.image
+        if self._faded_source is not self.image:
+            self._faded_image = self.image.copy()
+            self._faded_source = self.image
+        self._faded_image.set_alpha(self.alpha)
+        return self._faded_image
+
+    @property
+    def dirty_rect(self):
+        return self.border_rect
+
+    def get_draw_state(self):
+        return self.image, self.alpha, self.is_selected, self.is_hinted
+
+    def is_dirty(self):
+        return self.get_draw_state() != self._drawn_state
 
     def start_fade_out(self, new_card=None):
         self.next_card = new_card
@@ -85,48 +109,66 @@ class CardSprite(pygame.sprite.Sprite):
         pygame.time.set_timer(user_event.animation_done, 500)
 
     def draw(self, screen):
-        screen.blit(self.image, self.rect.topleft)
+        self._drawn_state = self.get_draw_state()
+        screen.blit(self.get_display_image(), self.rect.topleft)
         if self.is_selected:
-            pygame.draw.rect(screen, (0, 128, 0), self.rect.inflate(6, 6), 4)
+            pygame.draw.rect(screen, (0, 128, 0), self.border_rect, 4)
         elif self.is_hinted:
-            pygame.draw.rect(screen, (255, 0, 0), self.rect.inflate(6, 6), 4)
+            pygame.draw.rect(screen, (255, 0, 0), self.border_rect, 4)
         else:
-            pygame.draw.rect(screen, (240, 240, 240), self.rect.inflate(6, 6), 4)
+            pygame.draw.rect(screen, (240, 240, 240), self.border_rect, 4)
 
 
-# 🎯 게임 보드 클래스
+# 🎯 게임 보드 클래스 (규칙은 SetEngine, 여기서는 스프라이트·메시지·타이머 처리)
 class GameBoard:
     message_text = ''
     message_time = pygame.time.get_ticks()
     message_duration = 500
 
-    hint_index = 0
     last_click_time = 0
     click_delay = 300  # 밀리초 단위 (0.3초)
-    failure_count = 0
-
-    def __init__(self):
-        self.deck = generate_deck()
-        # self.deck = generate_deck(for_test=True)
-        self.deck_depleted = False
 
+    def __init__(self, seed=None):
+        self.engine = SetEngine(seed=seed)
+        self.engine.add_hint_listener(self.on_hint_sets_changed)
         self.sprites: list[CardSprite | None] = self.create_initial_sprites()
-        self.hint_sets = self.find_all_sets()
-        self.selected_idx = []
-        self.matched_sets = []
+
+    @property
+    def deck(self):
+        return self.engine.deck
+
+    @property
+    def hint_sets(self):
+        return self.engine.hint_sets
+
+    @property
+    def selected_idx(self):
+        return self.engine.selected
+
+    @property
+    def matched_sets(self):
+        return self.engine.matched_sets
+
+    @property
+    def failure_count(self):
+        return self.engine.failure_count
+
+    @property
+    def deck_depleted(self):
+        return self.engine.deck_depleted
+
+    @deck_depleted.setter
+    def deck_depleted(self, value):
+        self.engine.deck_depleted = value
 
     def get_score(self):
-        return len(self.matched_sets) * 3
+        return self.engine.get_score()
 
     def create_initial_sprites(self):
-        created = []
-        chosen = random.sample(self.deck, 12)
-        for idx, card in enumerate(chosen):
-            position = self.get_sprite_position(idx)
-            sprite = CardSprite(card, position)
-            created.append(sprite)
-            self.deck.remove(card)
-        return created
+        return [
+            CardSprite(card, self.get_sprite_position(idx))
+            for idx, card in enumerate(self.engine.slots)
+        ]
 
     @staticmethod
     def get_sprite_position(idx):
@@ -136,29 +178,18 @@ class GameBoard:
         return x, y
 
     def find_all_sets(self):
-        valid_indices = [i for i, s in enumerate(self.sprites) if s and s.card]
-        return [
-            combo for combo in combinations(valid_indices, 3)
-            if self.is_set(*(self.sprites[i].card for i in combo))
-        ]
+        return self.engine.find_all_sets()
 
     @staticmethod
     def is_set(c1: Card, c2: Card, c3: Card):
-        for attr in ['color', 'shape', 'count', 'fill']:
-            vals = {getattr(c, attr) for c in [c1, c2, c3]}
-            if len(vals) == 2:
-                return False
-        return True
+        return set_finder.is_set(c1, c2, c3)
 
     def handle_click(self, pos):
         for idx, sprite in enumerate(self.sprites):
-            if sprite.card and sprite.rect.collidepoint(pos):
-                if sprite.is_selected:
-                    sprite.is_selected = False
-                    self.selected_idx.remove(idx)
-                elif len(self.selected_idx) <= 3:
-                    sprite.is_selected = True
-                    self.selected_idx.append(idx)
+            # 교체 애니메이션 중인 카드는 이미 다른 카드로 바뀌었으므로 무시
+            if sprite.card and sprite.state == 'idle' and sprite.rect.collidepoint(pos):
+                if self.engine.toggle(idx):
+                    sprite.is_selected = idx in self.engine.selected
                 break
 
         if len(self.selected_idx) == 3:
@@ -171,35 +202,29 @@ class GameBoard:
         self.message_duration = int(duration * 1000)
 
     def check_set(self):
-        selected = []
         for i in self.selected_idx:
             sprite = self.sprites[i]
             sprite.is_selected = False
             sprite.is_hinted = False
-            if sprite and sprite.card:
-                selected.append(sprite.card)
 
-        if self.is_set(*selected):
+        result = self.engine.check_set()
+        if result is None:
+            return
+
+        if result.is_set:
             msg = '세트 성공!'
-            self.matched_sets.append(selected)
             pygame.time.set_timer(user_event.set_success, 500)
             pygame.time.set_timer(user_event.animation_done, 500)
         else:
             msg = '세트 실패!'
-            self.failure_count += 1
-            self.selected_idx.clear()
 
         self.show_message(msg)
-        logger.add(msg, 'SET_CHECK', selected)
+        logger.add(msg, 'SET_CHECK', result.cards)
 
-        if not self.hint_sets and not self.deck:
+        if result.deck_depleted:
             msg = '더 이상 매칭할 세트가 없습니다. 다시 시작할까요?'
-            duration = 3
-            self.deck_depleted = True
-
-            self.show_message(msg, duration)
-            logger.add(msg, 'SET_CHECK', selected)
-            self.selected_idx.clear()
+            self.show_message(msg, 3)
+            logger.add(msg, 'SET_CHECK', result.cards)
 
     def handle_hint(self):
         for sprite in self.sprites:
@@ -208,45 +233,62 @@ class GameBoard:
                 sprite.is_selected = False
 
         duration = 0.5
-        if self.hint_sets:
+        result = self.engine.hint()
+        if result.indices:
             msg = '세트가 존재합니다!'
-            for i in self.hint_sets[self.hint_index]:
+            for i in result.indices:
                 if sprite := self.sprites[i]:
                     sprite.is_hinted = True
-            self.hint_index += 1
-
-            if self.hint_index >= len(self.hint_sets):
-                self.hint_index = 0
+        elif result.replaced:
+            msg = '세트가 없어 카드를 모두 교체합니다!'
+            self.start_replacing(result.replaced)
         else:
-            if self.deck:
-                msg = '세트가 없어 카드를 모두 교체합니다!'
-                self.replace_all_cards()
-            else:
-                msg = '덱이 모두 소진되었습니다. 다시 시작할까요?'
-                duration = 3
-                self.deck_depleted = True
+            msg = '덱이 모두 소진되었습니다. 다시 시작할까요?'
+            duration = 3
 
         self.show_message(msg, duration)
         logger.add(msg, 'HINT')
-        self.selected_idx.clear()
         pygame.time.set_timer(user_event.animation_done, 500)
 
+    def on_hint_sets_changed(self, removed, _added):
+        # 사라진 세트에 남아 있는 힌트 표시는 지운다
+        for combo in removed:
+            for i in combo:
+                self.sprites[i].is_hinted = False
+
     def replace_all_cards(self):
-        self.deck += [s.card for s in self.sprites if s and s.card not in self.deck]
-        new_cards = random.sample(self.deck, len(self.sprites))  # 중복 없이 새 카드 뽑기
-        for i, sprite in enumerate(self.sprites):
-            new_card = new_cards[i]
-            self.deck.remove(new_card)
-            sprite.start_fade_out(new_card)  # 전체 카드 교체
+        self.start_replacing(self.engine.replace_all())  # 전체 카드 교체
+
+    def start_replacing(self, replaced):
+        for i, new_card in replaced:
+            self.sprites[i].start_fade_out(new_card)
+
+    def get_visible_message(self):
+        now = pygame.time.get_ticks()
+        if self.message_text and now - self.message_time < self.message_duration:
+            return self.message_text
+        return ''
+
+    @staticmethod
+    def get_message_rect():
+        return pygame.Rect(0, 700, CONST.WINDOW_WIDTH, FONT_1.get_linesize())
 
     def draw(self, screen):
-        for idx, sprite in enumerate(self.sprites):
+        self.update_sprites()
+        self.draw_sprites(screen)
+        self.draw_message(screen)
+
+    def update_sprites(self):
+        for sprite in self.sprites:
             sprite.update()
+
+    def draw_sprites(self, screen):
+        for sprite in self.sprites:
             sprite.draw(screen)
 
-        now = pygame.time.get_ticks()
-        if self.message_text and now - self.message_time < self.message_duration:
-            msg_surf = FONT_1.render(self.message_text, True, (0, 0, 0))
+    def draw_message(self, screen):
+        if message := self.get_visible_message():
+            msg_surf = text_cache.render(FONT_1, message, (0, 0, 0))
             screen.blit(msg_surf, (screen.get_width() // 2 - msg_surf.get_width() // 2, 700))
 
 
@@ -260,15 +302,31 @@ class SetGame:
     animating = False
     in_restart_dialog = False
 
-    def __init__(self):
+    def __init__(self, dirty_rects=CONST.DIRTY_RECTS, seed=None, profile_path=None, profile_overlay=False,
+                 alloc_tracker: AllocationTracker | None = None):
+        # dirty rect 모드: 바뀐 영역만 다시 그려 화면에 반영
+        self.dirty_rects = dirty_rects
+        self.needs_full_redraw = True
+        self.drawn_regions = {}
+
+        # 프레임 단계별 시간 측정 (종료시 profile_path 로 내보내기, overlay 로 화면 표시)
+        self.profiler = FrameProfiler(enabled=bool(profile_path or profile_overlay))
+        self.profile_path = profile_path
+        self.profile_overlay = profile_overlay
+        self.overlay_lines = []
+
+        # 프레임별 메모리 할당 추적 (python -m boardgame_set.alloc_tracker, --trace-alloc)
+        self.alloc_tracker = alloc_tracker or AllocationTracker(enabled=False)
+
         self.screen = pygame.display.set_mode((CONST.WINDOW_WIDTH, CONST.WINDOW_HEIGHT))
         pygame.display.set_caption('SET 게임 (Pygame 버전)')
 
-        self.board = GameBoard()
+        self.board = GameBoard(seed)
         self.event_handler = GameEventHandler(self)
 
         self.box_x = (self.screen.get_width() - CONST.MESSAGE_BOX_WIDTH) // 2
         self.box_y = (self.screen.get_height() - CONST.MESSAGE_BOX_HEIGHT) // 2
+        self.dialog_overlay = None  # 대화상자 배경 (처음 표시할 때 한 번만 생성)
 
         self.restart_btn = Button("다시 시작(R)", (CONST.WINDOW_WIDTH - 160, CONST.WINDOW_HEIGHT - 50))
         self.hint_btn = Button("힌트 보기(H)", (CONST.WINDOW_WIDTH - 300, CONST.WINDOW_HEIGHT - 50))
@@ -284,9 +342,10 @@ class SetGame:
 
     def show_restart_dialog(self):
         # 배경 어둡게 처리
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA).convert_alpha()
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        if self.dialog_overlay is None:
+            self.dialog_overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA).convert_alpha()
+            self.dialog_overlay.fill((0, 0, 0, 180))
+        self.screen.blit(self.dialog_overlay, (0, 0))
 
         # 메시지 박스
         pygame.draw.rect(
@@ -301,7 +360,7 @@ class SetGame:
         # 시간 및 성공/실패 횟수 표시
         time_text = self.get_play_time_text(self.end_ticks)
         time_msg, success_msg, fail_msg = self.get_game_score_message(time_text)
-        restart_msg = FONT_1.render('게임이 끝났습니다. 다시 시작할까요?', True, (0, 0, 0))
+        restart_msg = text_cache.render(FONT_1, '게임이 끝났습니다. 다시 시작할까요?', (0, 0, 0))
 
         self.screen.blit(time_msg, (x_position, y_position))
         self.screen.blit(success_msg, (x_position, y_position + 30))
@@ -321,20 +380,27 @@ class SetGame:
         return f'{minutes}:{seconds:02}'
 
     def get_game_score_message(self, time_text: str):
-        time_msg = FONT_1.render(f'시간 {time_text}', True, (0, 0, 0))
-        success_msg = FONT_1.render(f'성공 {len(self.board.matched_sets)}', True, (0, 0, 0))
-        fail_msg = FONT_1.render(f'실패 {self.board.failure_count}', True, (0, 0, 0))
+        time_msg = text_cache.render(FONT_1, f'시간 {time_text}', (0, 0, 0))
+        success_msg = text_cache.render(FONT_1, f'성공 {len(self.board.matched_sets)}', (0, 0, 0))
+        fail_msg = text_cache.render(FONT_1, f'실패 {self.board.failure_count}', (0, 0, 0))
         return time_msg, success_msg, fail_msg
 
     def button_is_clicked(self, button: str, event):
         if hasattr(self, button):
             return getattr(self, button).is_clicked(event.pos)
 
+    def log_start(self):
+        # 시드를 남겨 두면 같은 게임을 다시 재현할 수 있다
+        logger.add(f'게임이 시작되었습니다. (seed={self.board.engine.rng.seed})', 'START')
+
     def handle_restart_button(self):
         self.board = GameBoard()
         self.start_ticks = pygame.time.get_ticks()
         self.in_restart_dialog = self.board.deck_depleted = False
+        self.needs_full_redraw = True
+        logger.flush()  # 이전 게임 기록을 파일에 모두 남긴 뒤 초기화
         logger.clear()
+        self.log_start()
 
     def handle_mouse_click(self, event):
         self.animating = True
@@ -348,44 +414,32 @@ class SetGame:
 
     def handle_set_success(self):
         _board = self.board
-        if _board.deck:
-            # 덱에 카드가 있다면 교체
-            for i in _board.selected_idx:
-                sprite = _board.sprites[i]
-                new_card = random.choice(_board.deck)
-                _board.deck.remove(new_card)
-                sprite.start_fade_out(new_card)  # 세트 성공시 새 카드가 있는 경우
-        else:
-            # 덱에 카드가 없으면 해당 카드 제거
+        deck_empty = not _board.deck
+        if deck_empty:
             debug_logger.log("PRE_CARD_REMOVE", sprites=_board.sprites)
-            for i in _board.selected_idx:
-                sprite = _board.sprites[i]
-                sprite.start_fade_out()  # 세트 성공시 새 카드가 없는 경우
-            debug_logger.log("POST_CARD_REMOVE", sprites=_board.sprites)
 
-            if not _board.find_all_sets():
+        # 덱에 카드가 있다면 교체, 없으면 해당 카드 제거 (선택은 교체 후 초기화됨)
+        _board.start_replacing(_board.engine.replace_selected())
+
+        if deck_empty:
+            debug_logger.log("POST_CARD_REMOVE", sprites=_board.sprites)
+            if not _board.hint_sets:
                 self.in_restart_dialog = True
 
         pygame.time.set_timer(user_event.set_success, 0)  # 타이머 종료
-        _board.hint_sets = _board.find_all_sets()
-        _board.selected_idx.clear()  # 교체된 후에는 초기화
 
     def draw_log(self):
-        font = pygame.font.SysFont('나눔고딕', 18)
-        recent_logs = logger.log[-5:]
-        color_map = logger.color_map
+        font = get_font(CONST.FONT_NAME, 18)
+        recent_logs = logger.recent(5)
         for i, (ts, msg) in enumerate(recent_logs):
             color = (80, 80, 80)
-            for tag in color_map:
-                if msg.startswith(f'[{tag}]'):
-                    color = color_map[tag]
-            text = font.render(f'▶ {msg}', True, color)
+            for prefix, tag_color in LOG_TAG_COLORS:
+                if msg.startswith(prefix):
+                    color = tag_color
+            text = text_cache.render(font, f'▶ {msg}', color)
             self.screen.blit(text, (20, 600 + i * 20))  # 위치는 조정 가능
-        logger.save_to_file()
-
-    def render(self):
-        self.board.draw(self.screen)
 
+    def draw_hud(self):
         x_position = 20
         y_position = CONST.WINDOW_HEIGHT - 40
 
@@ -397,30 +451,139 @@ class SetGame:
         self.screen.blit(success_msg, (x_position, y_position - 30))
         self.screen.blit(fail_msg, (x_position, y_position))
 
-        self.restart_btn.draw(self.screen)
-        self.hint_btn.draw(self.screen)
-        self.draw_log()
+    def get_overlay_rect(self):
+        font = get_font(CONST.FONT_NAME, 14)
+        return pygame.Rect(0, 0, 260, font.get_linesize() * len(PROFILER_OVERLAY_ROWS) + 8)
 
-    def update_screen(self):
-        self.screen.fill(CONST.BACKGROUND_COLOR)
+    def draw_profiler_overlay(self):
+        # 통계는 30프레임마다 갱신 (매 프레임 새 텍스트를 만들지 않도록)
+        if not self.overlay_lines or self.profiler.frame_count % 30 == 0:
+            self.overlay_lines = self.profiler.overlay_lines()
+
+        font = get_font(CONST.FONT_NAME, 14)
+        rect = self.get_overlay_rect()
+        pygame.draw.rect(self.screen, (250, 250, 220), rect)
+        pygame.draw.rect(self.screen, (120, 120, 120), rect, 1)
+        for i, line in enumerate(self.overlay_lines):
+            self.screen.blit(text_cache.render(font, line, (40, 40, 40)), (6, 4 + i * font.get_linesize()))
+
+    def render(self):
+        profiler = self.profiler
+        with profiler.phase('update'):
+            self.board.update_sprites()
+        with profiler.phase('draw'):
+            self.board.draw_sprites(self.screen)
+            self.restart_btn.draw(self.screen)
+            self.hint_btn.draw(self.screen)
+        with profiler.phase('text'):
+            self.board.draw_message(self.screen)
+            self.draw_hud()
+        with profiler.phase('log_io'):
+            self.draw_log()
+        if self.profile_overlay:
+            self.draw_profiler_overlay()
+
+    def get_region_states(self):
+        # 영역 이름: (영역, 내용이 바뀌었는지 비교할 값)
+        board = self.board
+        return {
+            'message': (board.get_message_rect(), board.get_visible_message()),
+            'hud': (
+                pygame.Rect(0, CONST.WINDOW_HEIGHT - 100, CONST.WINDOW_WIDTH - 300, 100),
+                (self.get_play_time_text(pygame.time.get_ticks()), len(board.matched_sets), board.failure_count),
+            ),
+            'log': (pygame.Rect(0, 600, CONST.WINDOW_WIDTH, 100), tuple(logger.recent(5))),
+            'overlay': (self.get_overlay_rect(), tuple(self.overlay_lines)) if self.profile_overlay else (None, None),
+        }
+
+    def get_dirty_rects(self, regions):
+        with self.profiler.phase('update'):
+            self.board.update_sprites()
+        dirty = [sprite.dirty_rect for sprite in self.board.sprites if sprite.is_dirty()]
+
+        for name, (rect, state) in regions.items():
+            if rect is not None and self.drawn_regions.get(name) != state:
+                self.drawn_regions[name] = state
+                dirty.append(rect)
+        return dirty
+
+    def redraw_region(self, rect, regions):
+        # 영역 밖으로 번지지 않도록 clip 을 건 상태에서 겹치는 요소만 다시 그린다
+        screen = self.screen
+        screen.set_clip(rect)
+        screen.fill(CONST.BACKGROUND_COLOR)
+
+        for sprite in self.board.sprites:
+            if sprite.dirty_rect.colliderect(rect):
+                sprite.draw(screen)
+
+        if regions['message'][0].colliderect(rect):
+            self.board.draw_message(screen)
+        if regions['hud'][0].colliderect(rect):
+            self.draw_hud()
+        if regions['log'][0].colliderect(rect):
+            self.draw_log()
+        for button in (self.restart_btn, self.hint_btn):
+            if button.rect.colliderect(rect):
+                button.draw(screen)
+        if self.profile_overlay and regions['overlay'][0].colliderect(rect):
+            self.draw_profiler_overlay()
+        screen.set_clip(None)
+
+    def update_dirty_rects(self):
+        if self.needs_full_redraw:
+            self.needs_full_redraw = False
+            self.screen.fill(CONST.BACKGROUND_COLOR)
+            self.render()
+            self.drawn_regions = {name: state for name, (_, state) in self.get_region_states().items()}
+            with self.profiler.phase('present'):
+                pygame.display.flip()
+            return
+
+        regions = self.get_region_states()
+        dirty = self.get_dirty_rects(regions)
+        with self.profiler.phase('draw'):
+            for rect in dirty:
+                self.redraw_region(rect, regions)
+        if dirty:
+            with self.profiler.phase('present'):
+                pygame.display.update(dirty)
 
+    def update_screen(self):
         if self.in_restart_dialog:
+            self.screen.fill(CONST.BACKGROUND_COLOR)
             self.show_restart_dialog()
+            self.needs_full_redraw = True
+        elif self.dirty_rects:
+            self.update_dirty_rects()
         else:
+            self.screen.fill(CONST.BACKGROUND_COLOR)
             self.render()
+            with self.profiler.phase('present'):
+                pygame.display.flip()
+
+    def run_frame(self):
+        profiler, tracker = self.profiler, self.alloc_tracker
+        profiler.begin_frame()
+        tracker.begin_frame()
+        with profiler.phase('events'):
+            for event in pygame.event.get():
+                self.event_handler.handle(event)
 
-        pygame.display.update()
-        pygame.display.flip()
+        self.update_screen()
+        tracker.end_frame()
+        profiler.end_frame()
 
     def run(self):
-        logger.add('게임이 시작되었습니다.', 'START')
+        self.log_start()
+        self.alloc_tracker.start()
         while self.running:
-            for event in pygame.event.get():
-                self.event_handler.handle(event)
-
-            self.update_screen()
+            self.run_frame()
             self.clock.tick(60)
 
+        if self.profile_path:
+            self.profiler.export(self.profile_path)
+
 
 class GameEventHandler:
     def __init__(self, set_game: SetGame):
@@ -490,8 +653,6 @@ class GameEventHandler:
         _game, _board = self.game, self.game.board
         pygame.display.update()
         _game.animating = False
-        _board.hint_index = 0
-        _board.hint_sets = _board.find_all_sets()
         pygame.time.set_timer(user_event.animation_done, 0)
 
     def on_event_game_over(self, _):
@@ -510,6 +671,21 @@ class GameEventHandler:
 
 # 🚀 실행
 if __name__ == "__main__":
-    game = SetGame()
+    parser = argparse.ArgumentParser(description='SET 게임')
+    parser.add_argument('--seed', type=int, help='첫 게임의 시드 (로그의 START 기록으로 재현)')
+    parser.add_argument('--profile', metavar='PATH', help='종료시 프레임 시간 기록을 CSV/JSON 으로 저장')
+    parser.add_argument('--profile-overlay', action='store_true', help='프레임 시간 p50/p95/p99 를 화면에 표시')
+    parser.add_argument('--trace-alloc', metavar='PATH', help='종료시 프레임별 메모리 할당 보고서를 JSON 으로 저장')
+    args = parser.parse_args()
+
+    tracker = AllocationTracker(enabled=bool(args.trace_alloc))
+    game = SetGame(
+        seed=args.seed, profile_path=args.profile, profile_overlay=args.profile_overlay, alloc_tracker=tracker
+    )
     game.run()
+    if args.trace_alloc:
+        with open(args.trace_alloc, 'w', encoding='utf-8') as f:
+            json.dump(tracker.report(), f, ensure_ascii=False, indent=2)
+        tracker.stop()
+    logger.close()
     pygame.quit()
@@ -0,0 +1,92 @@
+import csv
+import json
+import time
+from array import array
+from contextlib import contextmanager, nullcontext
+
+# ⏱️ 프레임 단계별 소요 시간 (ms) 기록
+#    events: 이벤트 처리 / update: 스프라이트 갱신 / draw: 카드·버튼 그리기
+#    text: 메시지·HUD 텍스트 / log_io: 로그 패널 / present: 화면 반영
+PHASES = ('events', 'update', 'draw', 'text', 'log_io', 'present')
+COLUMNS = PHASES + ('total',)
+
+
+class FrameProfiler:
+    def __init__(self, capacity=600, enabled=True):
+        self.enabled = enabled
+        self.capacity = capacity
+        # 단계별 고정 크기 링 버퍼 (최근 capacity 프레임만 보관)
+        self.samples = {name: array('d', bytes(8 * capacity)) for name in COLUMNS}
+        self.frame_count = 0
+        self._current = dict.fromkeys(COLUMNS, 0.0)
+        self._frame_start = None
+
+    def __len__(self):
+        return min(self.frame_count, self.capacity)
+
+    def begin_frame(self):
+        if self.enabled:
+            self._current = dict.fromkeys(COLUMNS, 0.0)
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled or self._frame_start is None:
+            return
+        self._current['total'] = (time.perf_counter() - self._frame_start) * 1000
+        slot = self.frame_count % self.capacity
+        for name, value in self._current.items():
+            self.samples[name][slot] = value
+        self.frame_count += 1
+        self._frame_start = None
+
+    def phase(self, name):
+        if not self.enabled or self._frame_start is None:
+            return nullcontext()
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._current[name] += (time.perf_counter() - start) * 1000
+
+    def rows(self):
+        # 오래된 프레임부터 순서대로
+        count = len(self)
+        first = self.frame_count - count
+        for n in range(first, self.frame_count):
+            slot = n % self.capacity
+            yield n, {name: self.samples[name][slot] for name in COLUMNS}
+
+    def percentiles(self, name, points=(50, 95, 99)):
+        values = sorted(self.samples[name][:len(self)])
+        if not values:
+            return dict.fromkeys((f'p{p}' for p in points), 0.0)
+        return {f'p{p}': values[min(len(values) - 1, len(values) * p // 100)] for p in points}
+
+    def summary(self):
+        return {name: self.percentiles(name) for name in COLUMNS}
+
+    def export(self, path):
+        # 확장자가 .csv 이면 프레임별 CSV, 그 외에는 요약 + 프레임 목록 JSON
+        if path.endswith('.csv'):
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(('frame',) + COLUMNS)
+                for n, row in self.rows():
+                    writer.writerow([n] + [f'{row[name]:.4f}' for name in COLUMNS])
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'frames': len(self),
+                    'summary': self.summary(),
+                    'samples': [dict(frame=n, **row) for n, row in self.rows()],
+                }, f, indent=2)
+
+    def overlay_lines(self):
+        lines = ['phase     p50   p95   p99 (ms)']
+        for name, values in self.summary().items():
+            lines.append(f'{name:<8}' + ''.join(f'{values[p]:6.2f}' for p in ('p50', 'p95', 'p99')))
+        return lines
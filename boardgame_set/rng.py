@@ -0,0 +1,20 @@
+import random
+
+
+# 🎲 게임 하나가 쓰는 난수 스트림 (시드 하나에서 용도별 독립 스트림을 파생)
+#    deal: 처음 카드 배분 / refill: 세트 성공 후 보충 / reshuffle: 전체 교체
+class GameRng:
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        self.deal = self.substream('deal')
+        self.refill = self.substream('refill')
+        self.reshuffle = self.substream('reshuffle')
+
+    def substream(self, name) -> random.Random:
+        # 문자열 시드는 실행 환경(PYTHONHASHSEED)과 관계없이 항상 같은 난수열을 만든다
+        return random.Random(f'{self.seed}:{name}')
+
+    def __repr__(self):
+        return f'GameRng(seed={self.seed})'
@@ -0,0 +1,59 @@
+from boardgame_set.card import Card
+from boardgame_set.set_table import THIRD_ROWS, is_set_ids
+
+# 🔢 카드 코드 = 속성의 3진수 인코딩 (color, shape, count, fill 순서, Card.id)
+
+
+def encode_card(card: Card) -> int:
+    return card.id
+
+
+def third_code(a: int, b: int) -> int:
+    # 세트를 완성하는 세 번째 카드 (set_table 참조)
+    return THIRD_ROWS[a][b]
+
+
+def is_set(c1: Card, c2: Card, c3: Card) -> bool:
+    return is_set_ids(c1.id, c2.id, c3.id)
+
+
+def find_all_sets(cards: list[Card | None]) -> list[tuple[int, int, int]]:
+    # 카드 쌍마다 세 번째 카드를 계산해 보드 인덱스에서 찾는다 (O(n²))
+    present = [(i, encode_card(card)) for i, card in enumerate(cards) if card]
+    index = {code: i for i, code in present}
+
+    found = []
+    for n, (i, a) in enumerate(present):
+        row = THIRD_ROWS[a]
+        for j, b in present[n + 1:]:
+            k = index.get(row[b])
+            if k is not None and k > j:
+                found.append((i, j, k))
+    return found
+
+
+def find_sets_with(cards: list[Card | None], indices) -> list[tuple[int, int, int]]:
+    # indices 의 카드가 하나 이상 포함된 세트만 찾는다 (O(len(indices)·n))
+    codes = {i: encode_card(card) for i, card in enumerate(cards) if card}
+    index = {code: i for i, code in codes.items()}
+
+    found = set()
+    for i in indices:
+        if i not in codes:
+            continue
+        row = THIRD_ROWS[codes[i]]
+        for j, b in codes.items():
+            if j == i:
+                continue
+            k = index.get(row[b])
+            if k is not None and k != j:
+                found.add(tuple(sorted((i, j, k))))
+    return sorted(found)
+
+
+# 🃏 코드 → 카드 (encode_card 의 역변환, 코드 순서는 generate_deck 순서와 같다)
+ALL_CARDS = Card.all()
+
+
+def card_from_code(code: int) -> Card:
+    return ALL_CARDS[code]
@@ -0,0 +1,36 @@
+# 📋 81장 카드로 만들 수 있는 모든 세트를 미리 계산해 둔 표 (import 시 한 번만 생성)
+#    카드는 Card.id (속성의 3진수 인코딩, 0~80) 로 나타낸다.
+CARD_COUNT = 81
+_WEIGHTS = (27, 9, 3, 1)
+
+
+def _third(a, b):
+    # 각 자리에서 a + b + c ≡ 0 (mod 3) 을 만족하는 유일한 c
+    return sum((-(a // w) - (b // w)) % 3 * w for w in _WEIGHTS)
+
+
+# (a, b) → 세 번째 카드: THIRD[a * 81 + b] 또는 THIRD_ROWS[a][b]  (a == b 이면 a)
+THIRD = bytes(_third(a, b) for a in range(CARD_COUNT) for b in range(CARD_COUNT))
+THIRD_ROWS = tuple(THIRD[a * CARD_COUNT:(a + 1) * CARD_COUNT] for a in range(CARD_COUNT))
+
+# 세트 1080개 (a < b < c 순서) 와 카드별로 그 카드가 들어간 세트 40개
+ALL_SETS = tuple(
+    (a, b, c)
+    for a in range(CARD_COUNT) for b in range(a + 1, CARD_COUNT)
+    if (c := THIRD_ROWS[a][b]) > b
+)
+SETS_BY_CARD = tuple(
+    tuple(combo for combo in ALL_SETS if card in combo) for card in range(CARD_COUNT)
+)
+
+
+def third_card(a: int, b: int) -> int:
+    return THIRD_ROWS[a][b]
+
+
+def is_set_ids(a: int, b: int, c: int) -> bool:
+    return a != b and THIRD_ROWS[a][b] == c
+
+
+def sets_containing(card: int) -> tuple[tuple[int, int, int], ...]:
+    return SETS_BY_CARD[card]
@@ -0,0 +1,161 @@
+import argparse
+import json
+import os
+from collections import Counter
+from multiprocessing import Pool
+
+from boardgame_set.engine import SetEngine
+
+# 📊 게임별로 모으는 지표
+METRICS = ('sets_found', 'turns', 'no_set_events', 'reshuffles', 'cards_left')
+
+
+def play_game(seed, policy='first', board_size=12, max_turns=1000):
+    # 스크립트 정책으로 한 게임을 끝까지 진행하고 지표를 반환
+    engine = SetEngine(board_size, seed=seed)
+    policy_rng = engine.rng.substream('policy')
+    stats = dict.fromkeys(METRICS, 0)
+
+    for _ in range(max_turns):
+        stats['turns'] += 1
+        if engine.hint_sets:
+            chosen = engine.hint_sets[0] if policy == 'first' else policy_rng.choice(engine.hint_sets)
+            for idx in chosen:
+                engine.toggle(idx)
+            engine.check_set()
+            engine.replace_selected()
+            stats['sets_found'] += 1
+            continue
+
+        stats['no_set_events'] += 1
+        if not engine.hint().replaced:
+            break  # 덱이 비었거나 남은 카드로 세트를 만들 수 없음
+        stats['reshuffles'] += 1
+
+    stats['cards_left'] = sum(1 for card in engine.slots if card)
+    return stats
+
+
+def game_seed(base_seed, index):
+    # 워커 배정과 상관없이 게임마다 같은 시드를 쓰도록 (base_seed, index) 로 결정
+    return (base_seed << 32) | index
+
+
+def run_chunk(args):
+    chunk_id, start, stop, base_seed, policy, board_size = args
+    histograms = {metric: Counter() for metric in METRICS}
+    for index in range(start, stop):
+        stats = play_game(game_seed(base_seed, index), policy, board_size)
+        for metric, value in stats.items():
+            histograms[metric][value] += 1
+    return chunk_id, {metric: dict(counter) for metric, counter in histograms.items()}
+
+
+# 💾 체크포인트 (중단 후 이어서 실행)
+def load_checkpoint(path, config):
+    if not path or not os.path.exists(path):
+        return set(), {metric: Counter() for metric in METRICS}
+
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if data['config'] != config:
+        raise SystemExit(f'{path}: 설정이 다른 체크포인트입니다. ({data["config"]})')
+
+    histograms = {
+        metric: Counter({int(value): count for value, count in data['histograms'][metric].items()})
+        for metric in METRICS
+    }
+    return set(data['completed_chunks']), histograms
+
+
+def save_checkpoint(path, config, completed, histograms):
+    data = {
+        'config': config,
+        'completed_chunks': sorted(completed),
+        'histograms': {metric: dict(sorted(counter.items())) for metric, counter in histograms.items()},
+    }
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def summarize(histogram: Counter):
+    total = sum(histogram.values())
+    if not total:
+        return {}
+
+    values = sorted(histogram)
+    percentiles = {}
+    seen = 0
+    targets = [(50, 'p50'), (90, 'p90'), (99, 'p99')]
+    for value in values:
+        seen += histogram[value]
+        while targets and seen * 100 >= targets[0][0] * total:
+            percentiles[targets.pop(0)[1]] = value
+
+    return {
+        'games': total,
+        'mean': sum(value * count for value, count in histogram.items()) / total,
+        'min': values[0],
+        'max': values[-1],
+        **percentiles,
+        'histogram': {value: histogram[value] for value in values},
+    }
+
+
+def simulate(games, seed=0, policy='first', board_size=12, workers=None, chunk_size=500,
+             checkpoint=None, checkpoint_every=10):
+    config = {'games': games, 'seed': seed, 'policy': policy, 'board_size': board_size, 'chunk_size': chunk_size}
+    completed, histograms = load_checkpoint(checkpoint, config)
+
+    chunks = [
+        (chunk_id, start, min(start + chunk_size, games), seed, policy, board_size)
+        for chunk_id, start in enumerate(range(0, games, chunk_size))
+        if chunk_id not in completed
+    ]
+
+    with Pool(workers) as pool:
+        for done, (chunk_id, chunk_histograms) in enumerate(pool.imap_unordered(run_chunk, chunks), 1):
+            completed.add(chunk_id)
+            for metric, counts in chunk_histograms.items():
+                histograms[metric].update(counts)
+            if checkpoint and done % checkpoint_every == 0:
+                save_checkpoint(checkpoint, config, completed, histograms)
+
+    if checkpoint:
+        save_checkpoint(checkpoint, config, completed, histograms)
+    return {metric: summarize(counter) for metric, counter in histograms.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='SET 게임 일괄 시뮬레이션')
+    parser.add_argument('-n', '--games', type=int, default=10000, help='진행할 게임 수')
+    parser.add_argument('--seed', type=int, default=0, help='기준 시드 (게임별 시드는 여기서 파생)')
+    parser.add_argument('--policy', choices=['first', 'random'], default='first', help='찾은 세트 중 고르는 방식')
+    parser.add_argument('--board-size', type=int, default=12)
+    parser.add_argument('-j', '--workers', type=int, default=None, help='프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--chunk-size', type=int, default=500, help='워커에 한 번에 맡길 게임 수')
+    parser.add_argument('--checkpoint', help='체크포인트 파일 (있으면 이어서 실행)')
+    parser.add_argument('-o', '--output', help='결과를 JSON 으로 저장할 경로')
+    args = parser.parse_args(argv)
+
+    results = simulate(
+        args.games, args.seed, args.policy, args.board_size, args.workers, args.chunk_size, args.checkpoint
+    )
+
+    for metric, summary in results.items():
+        if not summary:
+            continue
+        print(
+            f'{metric:>14}: mean {summary["mean"]:.2f} | min {summary["min"]} | p50 {summary["p50"]} '
+            f'| p90 {summary["p90"]} | p99 {summary["p99"]} | max {summary["max"]}'
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import tracemalloc
+
+from boardgame_set import constants as CONST  # noqa
+from boardgame_set.alloc_tracker import AllocationTracker, check, run_headless
+
+
+def run_frames(tracker, frames, work):
+    tracker.start()
+    try:
+        for _ in range(frames):
+            tracker.begin_frame()
+            work()
+            tracker.end_frame()
+        return tracker.report()
+    finally:
+        tracker.stop()
+
+
+# 🧹 프레임마다 남는 객체는 growth 로, 버려지는 객체는 transient 로 잡힌다
+def test_detects_growth_and_call_site():
+    leaked = []
+    report = run_frames(AllocationTracker(warmup=5), 55, lambda: leaked.append(bytearray(1000)))
+
+    assert report['frames'] == 50
+    assert report['growth_bytes_per_frame'] >= 1000
+    assert report['top_sites'][0]['site'].endswith('test_alloc_tracker.py:21')
+    assert check(report, max_growth=256)
+
+
+def test_transient_allocations_do_not_count_as_growth():
+    report = run_frames(AllocationTracker(warmup=5), 55, lambda: bytearray(10000))
+
+    assert report['transient_bytes_per_frame'] >= 10000
+    assert report['growth_bytes_per_frame'] < 256
+    assert check(report, max_growth=256) == []
+    assert check(report, max_growth=256, max_transient=1000)
+
+
+def test_disabled_tracker_does_not_start_tracing():
+    tracker = AllocationTracker(enabled=False)
+    tracker.start()
+    assert not tracemalloc.is_tracing()
+    assert tracker.report()['frames'] == 0
+
+
+# 🎮 화면 없이 게임을 돌려 프레임당 메모리 증가가 기준 이하인지 확인
+def test_game_loop_memory_growth_is_bounded():
+    report = run_headless(frames=240, warmup=60, fps=0)
+    assert report['frames'] == 180
+    assert check(report, max_growth=CONST.ALLOC_MAX_GROWTH_PER_FRAME) == []
@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+from boardgame_set.atlas import CardAtlas, build_atlas, card_filenames
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(__file__))
+
+
+@pytest.fixture
+def in_package_dir(monkeypatch):
+    monkeypatch.chdir(PACKAGE_DIR)
+
+
+# 📦 아틀라스 생성/로드 테스트
+def test_build_and_load_atlas(in_package_dir, tmp_path):
+    path = build_atlas(str(tmp_path / 'cards.atlas'), size=(20, 30))
+    atlas = CardAtlas(path)
+
+    assert atlas.size == (20, 30)
+    assert all(name in atlas for name in card_filenames())
+    assert atlas['red_oval_1_solid'].get_size() == (20, 30)
+    atlas.close()
+
+
+def test_rebuilds_when_card_size_changes(in_package_dir, tmp_path):
+    path = build_atlas(str(tmp_path / 'cards.atlas'), size=(20, 30))
+    atlas = CardAtlas.load_or_build(path, size=(10, 15))
+
+    assert atlas.size == (10, 15)
+    atlas.close()
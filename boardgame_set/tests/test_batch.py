@@ -0,0 +1,43 @@
+import random
+
+import numpy as np
+
+from boardgame_set.batch import EMPTY, THIRD_CARD, count_sets, encode_boards, is_set_batch, set_masks
+from boardgame_set.engine import generate_deck
+from boardgame_set.set_finder import find_all_sets
+
+
+def _random_boards(count, size, seed=0):
+    rng = random.Random(seed)
+    deck = generate_deck()
+    boards = [rng.sample(deck, size) for _ in range(count)]
+    for board in boards[::4]:
+        board[rng.randrange(size)] = None  # 빈 칸 섞기
+    return boards
+
+
+# 🧮 단일 판정과 결과 비교
+def test_is_set_batch():
+    a = np.arange(81)
+    b = (a + 1) % 81
+    assert is_set_batch(a, b, THIRD_CARD[a, b]).all()
+    assert is_set_batch(0, 1, 2)
+    assert not is_set_batch(0, 1, 3)
+
+
+def test_count_sets_matches_set_finder():
+    boards = _random_boards(200, 15)
+    counts = count_sets(encode_boards(boards), chunk_size=64)
+    assert counts.tolist() == [len(find_all_sets(board)) for board in boards]
+
+
+def test_set_masks_match_set_finder():
+    boards = _random_boards(50, 12, seed=1)
+    masks, triples = set_masks(encode_boards(boards), chunk_size=16)
+    for board, mask in zip(boards, masks):
+        assert [tuple(t) for t in triples[mask]] == find_all_sets(board)
+
+
+def test_empty_board():
+    encoded = np.full((2, 12), EMPTY)
+    assert count_sets(encoded).tolist() == [0, 0]
@@ -0,0 +1,15 @@
+from boardgame_set.bench import bench_set_finder, compare
+
+
+# ⏱️ 기준 결과와 비교
+def test_compare_flags_only_slower_results():
+    baseline = {'results': {'a': {'min_us': 10.0}, 'b': {'min_us': 10.0}}}
+    report = {'results': {'a': {'min_us': 14.0}, 'b': {'min_us': 12.0}, 'new': {'min_us': 1.0}}}
+    assert compare(report, baseline, threshold=0.3) == [('a', 1.4)]
+
+
+def test_set_finder_benchmarks_run():
+    results = {}
+    bench_set_finder(results, {'repeat': 1, 'min_time': 0})
+    assert 'find_all_sets[81]' in results
+    assert results['is_set']['min_us'] > 0
@@ -0,0 +1,32 @@
+import copy
+import pickle
+
+import pytest
+
+from boardgame_set.card import Card
+
+
+# 💡 같은 속성은 같은 객체
+def test_cards_are_interned():
+    card = Card("red", "oval", 1, "solid")
+    assert card is Card("red", "oval", 1, "solid")
+    assert card is Card.from_id(card.id)
+    assert copy.deepcopy(card) is card
+    assert pickle.loads(pickle.dumps(card)) is card
+
+
+def test_card_identity_and_display():
+    card = Card("purple", "diamond", 3, "open")
+    assert card.id == 80
+    assert hash(card) == 80
+    assert card.filename == 'purple_diamond_3_open'
+    assert repr(card) == 'PUR◇3□'
+    assert [c.id for c in Card.all()] == list(range(81))
+
+
+def test_card_is_immutable_and_validated():
+    card = Card("green", "squiggle", 2, "striped")
+    with pytest.raises(AttributeError):
+        card.color = 'red'
+    with pytest.raises(ValueError):
+        Card("blue", "oval", 1, "solid")
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from boardgame_set.deck import Deck
+from boardgame_set.engine import generate_deck
+
+
+# 🂠 덱 기본 동작 테스트
+def test_draw_remove_and_membership():
+    cards = generate_deck()
+    deck = Deck(cards)
+    rng = random.Random(0)
+
+    drawn = deck.draw_many(rng, 12)
+    assert len(deck) == 69
+    assert len(set(drawn)) == 12
+    assert not any(card in deck for card in drawn)
+
+    removed = next(iter(deck))
+    deck.remove(removed)
+    assert removed not in deck
+    assert len(deck) == 68
+
+
+def test_add_back_and_duplicates():
+    cards = generate_deck()
+    deck = Deck(cards[:3])
+    with pytest.raises(ValueError):
+        deck.add(cards[0])
+
+    deck.remove(cards[1])
+    assert cards[1] not in deck
+    deck.add(cards[1])
+    assert set(deck) == set(cards[:3])
+
+
+def test_draw_until_empty():
+    deck = Deck(generate_deck())
+    rng = random.Random(1)
+    seen = {deck.draw(rng) for _ in range(81)}
+    assert len(seen) == 81
+    assert not deck
+    with pytest.raises(IndexError):
+        deck.draw(rng)
@@ -0,0 +1,150 @@
+import os
+import subprocess
+import sys
+
+from boardgame_set.engine import SetEngine
+from boardgame_set.set_finder import is_set
+
+
+# ⚙️ pygame 없이 동작하는지 확인
+def test_engine_does_not_import_pygame():
+    code = "import sys, boardgame_set.engine; assert 'pygame' not in sys.modules"
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=root)
+
+
+def test_initial_deal():
+    engine = SetEngine(seed=1)
+    assert len(engine.slots) == 12
+    assert len(engine.deck) == 69
+    assert not set(engine.slots) & set(engine.deck)
+
+
+# 🖱️ 선택 테스트
+def test_toggle_selection_limits_to_three():
+    engine = SetEngine(seed=1)
+    for idx in range(4):
+        engine.toggle(idx)
+    assert engine.selected == [0, 1, 2]
+
+    engine.toggle(1)
+    assert engine.selected == [0, 2]
+
+
+# 🧠 세트 판정 / 교체 테스트
+def test_check_valid_set_and_replace():
+    engine = SetEngine(seed=2)
+    a, b, c = engine.hint_sets[0]
+    for idx in (a, b, c):
+        engine.toggle(idx)
+
+    result = engine.check_set()
+    assert result.is_set
+    assert engine.matched_sets == [result.cards]
+
+    replaced = engine.replace_selected()
+    assert [i for i, _ in replaced] == [a, b, c]
+    assert all(card is not None for _, card in replaced)
+    assert len(engine.deck) == 66
+    assert engine.selected == []
+
+
+def test_check_invalid_set_counts_failure():
+    engine = SetEngine(seed=3)
+    triple = next(
+        (i, j, k) for i in range(12) for j in range(i + 1, 12) for k in range(j + 1, 12)
+        if not is_set(engine.slots[i], engine.slots[j], engine.slots[k])
+    )
+    for idx in triple:
+        engine.toggle(idx)
+
+    result = engine.check_set()
+    assert not result.is_set
+    assert engine.failure_count == 1
+    assert engine.selected == []
+
+
+# 💡 힌트 테스트
+def test_hint_cycles_through_sets():
+    engine = SetEngine(seed=4)
+    engine.hint_sets = [(0, 1, 2), (3, 4, 5)]
+    assert engine.hint().indices == (0, 1, 2)
+    assert engine.hint().indices == (3, 4, 5)
+    assert engine.hint().indices == (0, 1, 2)
+
+
+def test_hint_without_sets_replaces_all_cards():
+    engine = SetEngine(seed=5)
+    engine.hint_sets = []
+    result = engine.hint()
+
+    assert len(result.replaced) == 12
+    assert len(engine.deck) == 69
+
+
+# 🏁 전체 게임 진행 테스트
+def test_full_game_ends_with_empty_deck():
+    engine = SetEngine(seed=6)
+    for _ in range(1000):
+        if engine.hint_sets:
+            for idx in engine.hint_sets[0]:
+                engine.toggle(idx)
+            assert engine.check_set().is_set
+            engine.replace_selected()
+        elif not engine.hint().replaced:
+            break
+
+    assert engine.deck_depleted
+    assert not engine.deck
+    cards = [c for c in engine.slots if c] + [c for cards in engine.matched_sets for c in cards]
+    assert len(cards) == 81
+
+
+# 🔁 세트 목록 증분 갱신 테스트
+def test_incremental_hint_sets_match_full_scan():
+    engine = SetEngine(seed=7)
+    while engine.hint_sets:
+        for idx in engine.hint_sets[-1]:
+            engine.toggle(idx)
+        engine.check_set()
+        engine.replace_selected()
+        assert engine.hint_sets == engine.find_all_sets()
+
+
+def test_hint_listener_and_stable_hint_index():
+    engine = SetEngine(seed=8)
+    changes = []
+    engine.add_hint_listener(lambda removed, added: changes.append((removed, added)))
+
+    engine.hint_sets = [(0, 1, 2), (3, 4, 5), (6, 7, 8)]
+    engine.hint_index = 2
+    engine.set_hint_sets([(3, 4, 5), (6, 7, 8), (9, 10, 11)])
+
+    assert engine.hint_index == 1  # 여전히 (6, 7, 8) 을 가리킨다
+    assert changes == [([(0, 1, 2)], [(9, 10, 11)])]
+
+
+# 🎲 시드 재현 테스트
+def test_same_seed_replays_same_game():
+    def play(seed):
+        engine = SetEngine(seed=seed)
+        history = [list(engine.slots)]
+        for _ in range(5):
+            for idx in engine.hint_sets[0]:
+                engine.toggle(idx)
+            engine.check_set()
+            engine.replace_selected()
+            history.append(list(engine.slots))
+        return history
+
+    assert play(42) == play(42)
+    assert play(42) != play(43)
+
+
+def test_substreams_are_independent():
+    first, second = SetEngine(seed=9), SetEngine(seed=9)
+    second.hint_sets = []
+    second.hint()  # reshuffle 스트림만 사용
+
+    assert first.rng.reshuffle.getstate() != second.rng.reshuffle.getstate()
+    assert first.rng.refill.getstate() == second.rng.refill.getstate()
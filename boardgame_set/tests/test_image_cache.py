@@ -0,0 +1,34 @@
+import pygame
+
+from boardgame_set.image_cache import SurfaceCache
+
+
+class _BlankSurfaceCache(SurfaceCache):
+    loads = 0
+
+    def load(self, filename, size):
+        self.loads += 1
+        return pygame.Surface(size, pygame.SRCALPHA)
+
+
+# 🖼️ 캐시 적중 테스트
+def test_same_key_returns_shared_surface():
+    cache = _BlankSurfaceCache()
+    first = cache.get('red_oval_1_solid', (100, 150))
+    assert cache.get('red_oval_1_solid', (100, 150)) is first
+    assert cache.get('red_oval_1_solid', (50, 75)) is not first
+    assert cache.loads == 2
+
+
+# 🧹 바이트 예산 초과시 LRU 제거 테스트
+def test_evicts_least_recently_used():
+    size = (10, 10)
+    cache = _BlankSurfaceCache(max_bytes=2 * 10 * 10 * 4)
+    cache.get('a', size)
+    cache.get('b', size)
+    cache.get('a', size)
+    cache.get('c', size)
+
+    assert ('b', size) not in cache
+    assert ('a', size) in cache and ('c', size) in cache
+    assert cache.used_bytes <= cache.max_bytes
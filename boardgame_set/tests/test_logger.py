@@ -0,0 +1,64 @@
+from boardgame_set.logger import GameLogger
+
+
+# 📝 백그라운드 기록 테스트
+def test_entries_are_appended_on_flush(tmp_path):
+    path = tmp_path / 'game.log'
+    logger = GameLogger(str(path))
+
+    logger.add('게임이 시작되었습니다.', 'START')
+    logger.add('세트 성공!', 'SET_CHECK')
+    logger.add('세트 성공!', 'SET_CHECK')  # 연속 중복은 무시
+    logger.flush()
+
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert lines[0] == ''
+    assert lines[1].endswith('| [START] 게임이 시작되었습니다.')
+    assert lines[2].endswith('| [SET_CHECK] 세트 성공!')
+    assert len(lines) == 3
+    logger.close()
+
+
+def test_close_writes_pending_entries(tmp_path):
+    path = tmp_path / 'game.log'
+    logger = GameLogger(str(path))
+
+    for i in range(100):
+        logger.add(f'메시지 {i}')
+    logger.close()
+
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 100
+
+
+# 🔁 링 버퍼 / 파일 순환 테스트
+def test_log_keeps_only_recent_entries(tmp_path):
+    logger = GameLogger(str(tmp_path / 'game.log'), capacity=3)
+    for i in range(5):
+        logger.add(f'메시지 {i}')
+
+    assert [msg for _, msg in logger.log] == ['메시지 2', '메시지 3', '메시지 4']
+    assert [msg for _, msg in logger.recent(2)] == ['메시지 3', '메시지 4']
+    logger.close()
+
+
+def test_rotates_by_entry_count(tmp_path):
+    path = tmp_path / 'game.log'
+    logger = GameLogger(str(path), max_entries=4, backup_count=2)
+    for i in range(10):
+        logger.add(f'메시지 {i}')
+    logger.close()
+
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 2
+    assert len((tmp_path / 'game.log.1').read_text(encoding='utf-8').splitlines()) == 4
+    assert (tmp_path / 'game.log.2').exists()
+    assert not (tmp_path / 'game.log.3').exists()
+
+
+def test_last_log_time_reads_from_end(tmp_path):
+    path = tmp_path / 'game.log'
+    lines = [f'2025-07-29 21:41:{i % 60:02} | 메시지 {i}' for i in range(500)]
+    path.write_text('\n'.join(lines) + '\n\n', encoding='utf-8')
+
+    assert GameLogger.read_last_line(str(path), block_size=16) == lines[-1]
+    assert GameLogger.get_last_log_time(str(path)).second == 499 % 60
+    assert GameLogger.get_last_log_time(str(tmp_path / 'missing.log')).year == 1970
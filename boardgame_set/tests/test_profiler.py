@@ -0,0 +1,74 @@
+import csv
+import json
+
+from boardgame_set.profiler import COLUMNS, FrameProfiler
+
+
+def record(profiler, **phases):
+    profiler.begin_frame()
+    profiler._current.update(phases)
+    profiler.end_frame()
+
+
+# ⏱️ 링 버퍼는 최근 capacity 프레임만 보관
+def test_ring_buffer_keeps_latest_frames():
+    profiler = FrameProfiler(capacity=3)
+    for n in range(5):
+        record(profiler, draw=float(n))
+
+    assert len(profiler) == 3
+    assert [n for n, _ in profiler.rows()] == [2, 3, 4]
+    assert [row['draw'] for _, row in profiler.rows()] == [2.0, 3.0, 4.0]
+
+
+def test_phase_accumulates_and_total_is_measured():
+    profiler = FrameProfiler()
+    profiler.begin_frame()
+    for _ in range(2):
+        with profiler.phase('text'):
+            pass
+    profiler.end_frame()
+
+    _, row = next(profiler.rows())
+    assert row['text'] > 0
+    assert row['total'] >= row['text']
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = FrameProfiler(enabled=False)
+    profiler.begin_frame()
+    with profiler.phase('draw'):
+        pass
+    profiler.end_frame()
+    assert len(profiler) == 0
+
+
+def test_percentiles():
+    profiler = FrameProfiler(capacity=200)
+    for n in range(100):
+        record(profiler, update=float(n))
+
+    assert profiler.percentiles('update') == {'p50': 50.0, 'p95': 95.0, 'p99': 99.0}
+    assert FrameProfiler().percentiles('update')['p99'] == 0.0
+
+
+# 💾 CSV / JSON 내보내기
+def test_export_csv_and_json(tmp_path):
+    profiler = FrameProfiler()
+    record(profiler, events=1.0)
+    record(profiler, events=2.0)
+
+    csv_path = tmp_path / 'frames.csv'
+    profiler.export(str(csv_path))
+    with open(csv_path, encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['frame', *COLUMNS]
+    assert [float(row[1]) for row in rows[1:]] == [1.0, 2.0]
+
+    json_path = tmp_path / 'frames.json'
+    profiler.export(str(json_path))
+    with open(json_path, encoding='utf-8') as f:
+        data = json.load(f)
+    assert data['frames'] == 2
+    assert set(data['summary']) == set(COLUMNS)
+    assert data['samples'][1]['events'] == 2.0
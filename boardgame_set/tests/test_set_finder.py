@@ -0,0 +1,51 @@
+from itertools import combinations
+
+from boardgame_set.card import Card
+from boardgame_set.set_finder import encode_card, find_all_sets, is_set, third_code
+from boardgame_set import constants as CONST  # noqa
+
+
+def _all_cards():
+    return [
+        Card(c, s, n, f)
+        for c in CONST.CARD_COLORS for s in CONST.CARD_SHAPES
+        for n in CONST.CARD_COUNTS for f in CONST.CARD_FILLS
+    ]
+
+
+def _is_set_by_attrs(c1, c2, c3):
+    for attr in ['color', 'shape', 'count', 'fill']:
+        if len({getattr(c, attr) for c in [c1, c2, c3]}) == 2:
+            return False
+    return True
+
+
+# 🔢 인코딩 테스트
+def test_encode_card_is_unique():
+    codes = [encode_card(card) for card in _all_cards()]
+    assert codes == list(range(81))
+
+
+def test_third_code_completes_set():
+    cards = _all_cards()
+    for a, b in combinations(range(81), 2):
+        c = third_code(a, b)
+        assert c not in (a, b)
+        assert _is_set_by_attrs(cards[a], cards[b], cards[c])
+
+
+# 🧠 세트 판단 테스트
+def test_is_set():
+    assert is_set(Card("red", "oval", 1, "solid"), Card("red", "oval", 2, "solid"), Card("red", "oval", 3, "solid"))
+    assert not is_set(Card("red", "oval", 1, "solid"), Card("green", "oval", 2, "solid"), Card("red", "oval", 3, "solid"))
+
+
+# 🔍 전체 세트 탐색 테스트
+def test_find_all_sets_matches_brute_force():
+    cards = _all_cards()[::5] + [None, None]
+    expected = [
+        combo for combo in combinations([i for i, c in enumerate(cards) if c], 3)
+        if _is_set_by_attrs(*(cards[i] for i in combo))
+    ]
+    assert find_all_sets(cards) == expected
+    assert expected
@@ -0,0 +1,25 @@
+from itertools import combinations
+
+from boardgame_set.card import Card
+from boardgame_set.set_table import ALL_SETS, SETS_BY_CARD, is_set_ids, sets_containing, third_card
+
+
+def _is_set_by_attrs(*cards):
+    return all(len({getattr(c, attr) for c in cards}) != 2 for attr in ['color', 'shape', 'count', 'fill'])
+
+
+# 📋 전체 세트 표 테스트
+def test_all_sets_match_brute_force():
+    cards = Card.all()
+    expected = [combo for combo in combinations(range(81), 3) if _is_set_by_attrs(*(cards[i] for i in combo))]
+    assert list(ALL_SETS) == expected
+    assert len(ALL_SETS) == 1080
+
+
+def test_lookups():
+    a, b, c = ALL_SETS[100]
+    assert third_card(a, b) == c and third_card(c, b) == a
+    assert is_set_ids(a, b, c)
+    assert not is_set_ids(a, a, a)
+    assert all(len(sets) == 40 for sets in SETS_BY_CARD)
+    assert (a, b, c) in sets_containing(b)
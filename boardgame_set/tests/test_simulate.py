@@ -0,0 +1,34 @@
+from collections import Counter
+
+from boardgame_set.simulate import load_checkpoint, play_game, save_checkpoint, simulate, summarize
+
+
+# 🎲 같은 시드는 같은 결과
+def test_play_game_is_reproducible():
+    assert play_game(123) == play_game(123)
+    stats = play_game(123, policy='random')
+    assert stats['sets_found'] * 3 + stats['cards_left'] <= 81
+
+
+def test_summarize_percentiles():
+    summary = summarize(Counter({1: 50, 2: 40, 10: 10}))
+    assert summary['games'] == 100
+    assert (summary['p50'], summary['p90'], summary['p99']) == (1, 2, 10)
+
+
+# 💾 체크포인트에서 이어서 실행
+def test_resume_skips_completed_chunks(tmp_path):
+    path = str(tmp_path / 'checkpoint.json')
+    config = {'games': 20, 'seed': 7, 'policy': 'first', 'board_size': 12, 'chunk_size': 5}
+    full = simulate(20, seed=7, workers=1, chunk_size=5, checkpoint=path)
+
+    # 마지막 묶음 전에 중단된 상태를 만든다
+    _, partial = load_checkpoint(None, config)
+    for index in range(15):
+        for metric, value in play_game((7 << 32) | index).items():
+            partial[metric][value] += 1
+    save_checkpoint(path, config, {0, 1, 2}, partial)
+
+    resumed = simulate(20, seed=7, workers=1, chunk_size=5, checkpoint=path)
+    assert resumed == full
+    assert load_checkpoint(path, config)[0] == {0, 1, 2, 3}
@@ -0,0 +1,30 @@
+import pygame
+import pytest
+
+from boardgame_set.text_cache import TextCache
+
+
+@pytest.fixture
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 20)
+
+
+# 📝 같은 텍스트는 다시 렌더링하지 않는다
+def test_render_is_memoized(font):
+    cache = TextCache()
+    surf = cache.render(font, '시간 0:01', (0, 0, 0))
+    assert cache.render(font, '시간 0:01', [0, 0, 0]) is surf
+    assert cache.render(font, '시간 0:01', (255, 0, 0)) is not surf
+    assert len(cache) == 2
+
+
+def test_evicts_oldest_entry(font):
+    cache = TextCache(max_entries=2)
+    first = cache.render(font, 'a', (0, 0, 0))
+    cache.render(font, 'b', (0, 0, 0))
+    cache.render(font, 'a', (0, 0, 0))
+    cache.render(font, 'c', (0, 0, 0))
+
+    assert len(cache) == 2
+    assert cache.render(font, 'a', (0, 0, 0)) is first
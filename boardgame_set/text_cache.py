@@ -0,0 +1,41 @@
+from collections import OrderedDict
+from functools import lru_cache
+
+import pygame
+
+from boardgame_set import constants as CONST  # noqa
+
+
+# 🔤 글꼴은 (이름, 크기, 굵기)별로 한 번만 찾는다
+@lru_cache(maxsize=None)
+def get_font(name=CONST.FONT_NAME, size=20, bold=False) -> pygame.font.Font:
+    return pygame.font.SysFont(name, size, bold)
+
+
+# 📝 (font, text, color, antialias)별 렌더링 결과 캐시 (LRU, 개수 제한)
+class TextCache:
+    def __init__(self, max_entries=CONST.TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, font: pygame.font.Font, text, color, antialias=True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+text_cache = TextCache()